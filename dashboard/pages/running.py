@@ -8,8 +8,10 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
-# Add project root to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root to path for imports (once, even if the module is reloaded)
+_ROOT = str(Path(__file__).parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from core.model import TaxComplianceModel
 from core.config import SimulationConfig, deep_merge
@@ -68,9 +70,6 @@ def build_config_overrides(params: dict) -> dict:
     # Social dynamics
     overrides["social"] = {
         "social_influence": params.get("social_influence"),
-        # Legacy boosts deprecated, but kept just in case
-        "pso_boost": params.get("pso_boost", 0.0),
-        "trust_boost": params.get("trust_boost", 0.0),
     }
 
     # Service & Transparency Update (New)
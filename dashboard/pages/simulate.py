@@ -3,17 +3,21 @@ Simulate Page - Configure simulation settings.
 Three-tier settings hierarchy with nested expanders.
 Professional design for Tax Authority dashboard.
 """
-import json
+import hashlib
+import orjson
 import streamlit as st
-import streamlit_nested_layout  # Enables nested expanders
 from scipy.stats import norm
 import sys
 from pathlib import Path
 
-# Add project root to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root to path for imports (once, even if the module is reloaded)
+_ROOT = str(Path(__file__).parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from core.config import SimulationConfig
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
 
@@ -30,6 +34,99 @@ class BudgetConfig:
 # Load defaults from actual config files
 _cfg = SimulationConfig.default()
 
+
+@lru_cache(maxsize=1)
+def _load_default_config() -> dict:
+    """Default config tree, read from disk once per process. Do not mutate the result."""
+    return SimulationConfig.load_defaults()
+
+
+def _config_digest(raw: bytes) -> str:
+    """Content hash of an uploaded config, used for dedupe and as the parse cache key."""
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _parse_config(digest: str, _raw: bytes) -> dict:
+    """Parse uploaded config bytes. Cached on `digest` (last 32 uploads); `_raw` is excluded from hashing."""
+    return orjson.loads(_raw)
+
+
+# Static page chrome, built once at import
+_HEADER_HTML = """
+    <div style="display:flex; align-items:baseline; gap:16px; padding-top: 10px; margin-bottom: 0px;">
+        <span style="font-size: 28px; font-weight: 700; color: #1A1A1A;">
+            Configure Simulation
+        </span>
+        <span style="font-size: 14px; color: #718096;">
+            Adjust parameters and run
+        </span>
+    </div>
+"""
+_HEADER_SEPARATOR_HTML = '<div style="border-bottom:1px solid #D1D9E0; margin-bottom:12px; margin-top:-12px;"></div>'
+_SPACER_HTML = "<div style='height: 12px'></div>"
+_ACTION_BAR_HR_HTML = '<hr style="margin-top: 12px; margin-bottom: 8px; border: none; border-top: 1px solid #D1D9E0;">'
+_SECTION_HEADING_HTML = """
+    <div style="margin-top: 32px; margin-bottom: 12px;">
+        <span style="font-size: 18px; font-weight: 600; color: #1A1A1A;">{title}</span>
+        <div style="border-bottom: 1px solid #D1D9E0; margin-top: 8px;"></div>
+    </div>
+"""
+_STRATEGY_HEADING_HTML = _SECTION_HEADING_HTML.format(title="Tax Authority Strategy")
+_ALGORITHM_HEADING_HTML = _SECTION_HEADING_HTML.format(title="Algorithm Configuration")
+_BUDGET_METER_HTML = """
+    <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 12px; background: #F7FAFC; border-radius: 8px; margin-top: 12px;">
+        <div>
+            <span style="font-weight: 600;">Budget:</span> ${total_budget:,}
+        </div>
+        <div>
+            <span style="font-weight: 600;">Allocated:</span> ${total_spent:,.0f}
+        </div>
+        <div style="color: {meter_color}; font-weight: 600;">
+            <span>Remaining:</span> ${remaining:,.0f}
+        </div>
+    </div>
+"""
+_BUDGET_EXCEEDED_HTML = '<div style="color: #E53E3E; font-size: 12px; text-align: center; margin-top: 4px;">Budget exceeded. Reduce spending.</div>'
+_HUBA_COST_HTML = "<div style='color: #718096; font-size: 12px;'>Cost: ${cost:,}</div>"
+_LOADED_CONFIG_HTML = "<div style='text-align: center; color: #333333; font-size: 14px; margin-top: -10px; font-weight: 500;'>Loaded: {name}</div>"
+
+# Per-row fragments of synced_slider_input / compact_text_input
+_SLIDER_DEFAULT_HTML = '<div style="width: 80px; text-align: center; margin-top: 4px; font-size: 10px; color: #718096; white-space: nowrap;">Default: {}</div>'
+_DERIVED_VALUE_HTML = '<div style="font-size: 11px; color: #718096; margin-top: -8px;">→ {}</div>'
+_COMPACT_LABEL_HTML = '<span style="font-size: 1.05rem; font-weight: 600;">{}</span>'
+_COMPACT_DEFAULT_HTML = (
+    '<div style="position: relative; width: 80px; height: 12px; margin-top: 2px;">'
+    '<span style="position: absolute; top: 0; left: 50%; transform: translateX(-50%); '
+    'font-size: 10px; color: #718096; white-space: nowrap;">Default: {}</span></div>'
+)
+
+# Help text shared by the budget-mode and normal-mode HUBA toggles
+_HUBA_TOGGLE_HELP = "Enable High Utility Business Audit (HUBA) program transparency effects."
+
+# Fixed column ratios (simulate.css targets the slider/compact rows by shape)
+_PAGE_COLS = (1, 4, 1)
+_HEADER_COLS = (4, 1.2, 1)
+_SLIDER_ROW_COLS = (4, 0.8, 0.4)
+_COMPACT_ROW_COLS = (1, 1, 1)
+_ACTION_BAR_COLS = (2, 3, 2)
+
+# Selection strategy options shared by the audit, letter and phone selectboxes
+_STRATEGY_OPTIONS = ("random", "risk", "network")
+# Config/params strategy names -> selectbox options ("risk_based" is shown as "risk")
+_WIDGET_STRATEGIES = {"random": "random", "risk_based": "risk", "risk": "risk", "network": "network"}
+_AUDIT_STRATEGY_LABELS = {
+    "random": "Random Selection",
+    "risk": "Risk-Based",
+    "network": "Network Connectivity",
+}
+_INTERVENTION_STRATEGY_LABELS = {
+    "random": "Random",
+    "risk": "Risk-Based",
+    "network": "Network",
+}
+
+
 def vertical_separator(rows=1):
     """
     Renders a vertical line separator with height calculated based on number of rows.
@@ -274,22 +371,82 @@ def _get_default_values():
         "spend_web_priv": 3000,
         "spend_web_biz": 3750,
         "spend_huba": 0,
+
+        # Strategy selectboxes, seeded by key rather than index= so config loads never clash with a default
+        "sel_audit": _WIDGET_STRATEGIES.get(_cfg.enforcement["audit_strategy"], "random"),
+        "sel_letter_strategy": "random",
+        "sel_phone_strategy": "random",
     }
 
-DEFAULT_VALUES = _get_default_values()
+# Read-only view: widgets and reset_to_defaults copy from it, nothing may write to it
+DEFAULT_VALUES = MappingProxyType(_get_default_values())
+
+@lru_cache(maxsize=256, typed=True)
+def _format_default(default, format_str: str = None) -> str:
+    """Format a widget default for the 'Default: X' hint and reset tooltip."""
+    if isinstance(default, float):
+        if format_str:
+            return format_str % default
+        if default != int(default):
+            return f"{default:.2f}"
+        return str(int(default))
+    return str(default)
+
+@lru_cache(maxsize=64)
+def _honesty_caption(threshold, mean, std) -> str:
+    """'Projected Honesty' caption: share of N(mean, std) compliance inclinations above the threshold."""
+    honest_pct = norm.sf(threshold, loc=mean, scale=std) * 100
+    return f"Projected Honesty: {honest_pct:.1f}% with N(μ={mean}, σ={std})"
 
 def reset_to_defaults():
     """Reset all session state values to their defaults and trigger local slider resets."""
     # 1. Reset standard session state keys from DEFAULT_VALUES
-    for key, value in DEFAULT_VALUES.items():
-        st.session_state[key] = value
+    st.session_state.update(DEFAULT_VALUES)
     
     # 2. Trigger local reset for all UI sliders that have been initialized
     # This ensures they pick up their 'default' argument and refresh handle via version increment.
-    sync_keys = [k for k in st.session_state.keys() if k.endswith("_sync_v")]
-    for k in sync_keys:
-        master_key = k.rsplit("_sync_v", 1)[0]
-        st.session_state[f"{master_key}_do_reset"] = True
+    st.session_state.update({
+        f"{k.rsplit('_sync_v', 1)[0]}_do_reset": True
+        for k in st.session_state.keys() if k.endswith("_sync_v")
+    })
+
+
+# Callbacks for bidirectional slider <-> number input sync (shared by every synced_slider_input)
+def _on_slider_change(master_k, sl_k):
+    # User moved slider -> update master state and input box
+    val = st.session_state[sl_k]
+    st.session_state[master_k] = val
+    st.session_state[f"{master_k}_input"] = val
+
+
+def _on_input_change(master_k, min_v, max_v):
+    # User typed value -> update master state and increment version to force slider refresh
+    val = st.session_state[f"{master_k}_input"]
+    clamped = max(min_v, min(max_v, val))
+    st.session_state[master_k] = clamped
+    st.session_state[f"{master_k}_input"] = clamped
+    st.session_state[f"{master_k}_sync_v"] += 1 # Change key to force visual sync
+
+
+def _on_slider_reset(master_k, default):
+    # Reset button -> restore default and increment version to force slider refresh
+    st.session_state[master_k] = default
+    st.session_state[f"{master_k}_input"] = default
+    st.session_state[f"{master_k}_sync_v"] += 1
+
+
+def _on_compact_input_change(master_k, min_v, max_v):
+    # User typed value -> clamp into range and store as the master value
+    val = st.session_state[f"txt_{master_k}_input"]
+    if min_v is not None:
+        val = max(min_v, val)
+    if max_v is not None:
+        val = min(max_v, val)
+    st.session_state[master_k] = val
+
+
+def _on_compact_reset(master_k, default):
+    st.session_state[master_k] = default
 
 
 def synced_slider_input(
@@ -312,14 +469,11 @@ def synced_slider_input(
     If budget_config is provided, shows derived metric text below the slider.
     """
     # 1. State Maintenance & Synchronization Architecture
-    if key not in st.session_state:
-        st.session_state[key] = default
-    if f"{key}_input" not in st.session_state:
-        st.session_state[f"{key}_input"] = default
-    if f"{key}_sync_v" not in st.session_state:
-        st.session_state[f"{key}_sync_v"] = 1  # Version counter for the dynamic key
+    st.session_state.setdefault(key, default)
+    st.session_state.setdefault(f"{key}_input", default)
+    st.session_state.setdefault(f"{key}_sync_v", 1)  # Version counter for the dynamic key
 
-    # Local Slider Reset logic
+    # Reset Defaults logic (the per-row reset button uses _on_slider_reset)
     reset_flag_key = f"{key}_do_reset"
     if st.session_state.get(reset_flag_key, False):
         st.session_state[reset_flag_key] = False
@@ -327,30 +481,12 @@ def synced_slider_input(
         st.session_state[f"{key}_input"] = default
         st.session_state[f"{key}_sync_v"] += 1 # Change key to force visual reset
 
-    # Callbacks for bidirectional sync
-    def on_slider_change(master_k, sl_k):
-        # User moved slider -> update master state and input box
-        val = st.session_state[sl_k]
-        st.session_state[master_k] = val
-        st.session_state[f"{master_k}_input"] = val
-
-    def on_input_change(master_k, min_v, max_v):
-        # User typed value -> update master state and increment version to force slider refresh
-        val = st.session_state[f"{master_k}_input"]
-        clamped = max(min_v, min(max_v, val))
-        st.session_state[master_k] = clamped
-        st.session_state[f"{master_k}_input"] = clamped
-        st.session_state[f"{master_k}_sync_v"] += 1 # Change key to force visual sync
-
     # Helper for default string display
-    if isinstance(default, float):
-        default_str = format_str % default if format_str else (f"{default:.2f}" if default != int(default) else str(int(default)))
-    else:
-        default_str = str(default)
+    default_str = _format_default(default, format_str)
     
     # Three columns: slider | input | reset button
     # Tight ratios that keep input and reset close together
-    col_sl, col_in, col_reset = st.columns([4, 0.8, 0.4], gap="small")
+    col_sl, col_in, col_reset = st.columns(_SLIDER_ROW_COLS, gap="small")
     
     
     
@@ -367,20 +503,18 @@ def synced_slider_input(
         if slider_key not in st.session_state:
             st.session_state[slider_key] = st.session_state[key]
             
-        slider_kwargs = {
-            "label": f"{label} Slider",
-            "min_value": min_value, 
-            "max_value": max_value,
-            "step": step,
-            "key": slider_key,
+        st.slider(
+            f"{label} Slider",
+            min_value=min_value,
+            max_value=max_value,
+            step=step,
+            key=slider_key,
             # CRITICAL: Omit 'value' here. Focus stays during drag.
-            "label_visibility": "collapsed",
-            "help": help_text,
-            "on_change": on_slider_change,
-            "args": (key, slider_key)
-        }
-            
-        st.slider(**slider_kwargs)
+            label_visibility="collapsed",
+            help=help_text,
+            on_change=_on_slider_change,
+            args=(key, slider_key),
+        )
 
         # BUDGET MODE: Show derived metric text below slider
         if budget_config is not None:
@@ -397,39 +531,27 @@ def synced_slider_input(
             # Store derived value for simulation
             st.session_state[f"{key}_derived"] = derived
             
-            st.markdown(
-                f'<div style="font-size: 11px; color: #718096; margin-top: -8px;">→ {budget_config.param_format % derived}</div>',
-                unsafe_allow_html=True
-            )
+            st.markdown(_DERIVED_VALUE_HTML.format(budget_config.param_format % derived), unsafe_allow_html=True)
     
     with col_in:
-        input_kwargs = {
-            "label": label,
-            "min_value": input_min if input_min is not None else min_value,
-            "max_value": input_max if input_max is not None else max_value,
-            "step": step,
-            "key": f"{key}_input",
-            "label_visibility": "collapsed",
-            "on_change": on_input_change,
-            "args": (key, min_value, max_value)
-        }
-        
-        if format_str:
-            input_kwargs["format"] = format_str
-            
-        st.number_input(**input_kwargs)
+        st.number_input(
+            label,
+            min_value=input_min if input_min is not None else min_value,
+            max_value=input_max if input_max is not None else max_value,
+            step=step,
+            format=format_str,
+            key=f"{key}_input",
+            label_visibility="collapsed",
+            on_change=_on_input_change,
+            args=(key, min_value, max_value),
+        )
         
         # Show default value
-        st.markdown(
-            f'''<div style="width: 80px; text-align: center; margin-top: 4px; font-size: 10px; color: #718096; white-space: nowrap;">Default: {default_str}</div>''',
-            unsafe_allow_html=True
-        )
+        st.markdown(_SLIDER_DEFAULT_HTML.format(default_str), unsafe_allow_html=True)
     
     with col_reset:
-        if st.button("↻", key=f"{key}_reset", help=f"Reset to default: {default_str}"):
-            # We set a flag to perform a full reset on next rerun
-            st.session_state[f"{key}_do_reset"] = True
-            st.rerun()
+        st.button("↻", key=f"{key}_reset", help=f"Reset to default: {default_str}",
+                  on_click=_on_slider_reset, args=(key, default))
 
     
     return st.session_state[key]
@@ -455,26 +577,11 @@ def compact_text_input(
     │                   default: X.XX                     │
     └─────────────────────────────────────────────────────┘
     """
-    # Reset flag key - use 'txt_' prefix to differentiate from slider resets
-    reset_flag_key = f"txt_{key}_do_reset"
-    if st.session_state.get(reset_flag_key, False):
-        st.session_state[reset_flag_key] = False
-        st.session_state[key] = default
-    
     # Initialize state
-    if key not in st.session_state:
-        st.session_state[key] = default
+    st.session_state.setdefault(key, default)
     
     # Format default for display
-    if isinstance(default, float):
-        if format_str:
-            default_str = format_str % default
-        elif default != int(default):
-            default_str = f"{default:.2f}"
-        else:
-            default_str = str(int(default))
-    else:
-        default_str = str(default)
+    default_str = _format_default(default, format_str)
     
     # Determine step if not provided
     if step is None:
@@ -482,129 +589,336 @@ def compact_text_input(
     
     # Three columns layout: label | input | reset
     # Equal ratios - CSS will override with fixed widths for precise proximity
-    col_label, col_input, col_reset = st.columns([1, 1, 1], gap="small")
+    col_label, col_input, col_reset = st.columns(_COMPACT_ROW_COLS, gap="small")
     
     with col_label:
         # Class-based marker for robust CSS targeting
         st.markdown('<div class="compact-marker"></div>', unsafe_allow_html=True)
         # Label with optional help tooltip - ADJUSTED SIZE TO MATCH SLIDERS
-        label_html = f'<span style="font-size: 1.05rem; font-weight: 600;">{label}</span>'
+        label_html = _COMPACT_LABEL_HTML.format(label)
         if help_text:
-            st.markdown(f"{label_html}", help=help_text, unsafe_allow_html=True)
+            st.markdown(label_html, help=help_text, unsafe_allow_html=True)
         else:
-            st.markdown(f"{label_html}", unsafe_allow_html=True)
+            st.markdown(label_html, unsafe_allow_html=True)
     
     with col_input:
-        input_kwargs = {
-            "label": label,
-            "value": st.session_state[key],
-            "step": step,
-            "key": f"txt_{key}_input",
-            "label_visibility": "collapsed",
-        }
-        if min_value is not None:
-            input_kwargs["min_value"] = min_value
-        if max_value is not None:
-            input_kwargs["max_value"] = max_value
-        if format_str:
-            input_kwargs["format"] = format_str
-            
-        input_val = st.number_input(**input_kwargs)
-        
-        # Default value below input - tight styling
-        st.markdown(
-            f'''<div style="
-                position: relative;
-                width: 80px;
-                height: 12px;
-                margin-top: 2px;
-            ">
-                <span style="
-                    position: absolute;
-                    top: 0;
-                    left: 50%;
-                    transform: translateX(-50%);
-                    font-size: 10px;
-                    color: #718096;
-                    white-space: nowrap;
-                ">Default: {default_str}</span>
-            </div>''',
-            unsafe_allow_html=True
+        # None bounds/format are Streamlit's own defaults, so they pass straight through
+        st.number_input(
+            label,
+            value=st.session_state[key],
+            min_value=min_value,
+            max_value=max_value,
+            step=step,
+            format=format_str,
+            key=f"txt_{key}_input",
+            label_visibility="collapsed",
+            on_change=_on_compact_input_change,
+            args=(key, min_value, max_value),
         )
         
-        # Sync back to state if changed
-        if input_val != st.session_state[key]:
-            new_val = input_val
-            if min_value is not None:
-                new_val = max(min_value, new_val)
-            if max_value is not None:
-                new_val = min(max_value, new_val)
-            st.session_state[key] = new_val
-            st.rerun()
+        # Default value below input - tight styling
+        st.markdown(_COMPACT_DEFAULT_HTML.format(default_str), unsafe_allow_html=True)
     
     with col_reset:
         # Reset button - same pattern as slider reset
-        reset_key = f"txt_{key}_reset"
-        if st.button("↻", key=reset_key, help=f"Reset to default: {default_str}"):
-            st.session_state[reset_flag_key] = True
-            st.rerun()
+        st.button("↻", key=f"txt_{key}_reset", help=f"Reset to default: {default_str}",
+                  on_click=_on_compact_reset, args=(key, default))
     
     return st.session_state[key]
 
 
+# Deep trait rows: (state key stem, DEFAULT_VALUES stem, label, mean range, std range, help)
+_TRAIT_ROWS = (
+    ("audit", "audit_belief", "Subj. Audit Prob.", (0.0, 100.0), (0.0, 50.0), "Perceived probability of being audited (0-100%)."),
+    ("pn", "pn", "Personal Norms", (1.0, 5.0), (0.0, 2.0), None),
+    ("sn", "sn", "Social Norms", (1.0, 5.0), (0.0, 2.0), None),
+    ("stn", "stn", "Societal Norms", (1.0, 5.0), (0.0, 2.0), None),
+    ("pso", "pso", "Perceived Service (PSO)", (1.0, 5.0), (0.0, 2.0), None),
+    ("pt", "pt", "Trust Baseline", (1.0, 5.0), (0.0, 2.0), None),
+)
+_BIZ_TRAIT_LABELS = {"pn": "Business Norms"}
+
+
+def _render_trait_rows(prefix: str):
+    """Render the mean/std input pairs for one agent type ("priv" or "biz")."""
+    with st.container():
+        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
+        for stem, default_stem, label, mean_range, std_range, help_text in _TRAIT_ROWS:
+            if prefix == "biz":
+                label = _BIZ_TRAIT_LABELS.get(stem, label)
+            c_mean, c_std = st.columns(2)
+            with c_mean: compact_text_input(f"{label} Mean (μ)", f"{prefix}_{stem}_mean", DEFAULT_VALUES[f"{prefix}_{default_stem}_value"], *mean_range, help_text=help_text)
+            with c_std: compact_text_input(f"{label} Std. (σ)", f"{prefix}_{stem}_std", DEFAULT_VALUES[f"{prefix}_{default_stem}_std"], *std_range)
+
+
+_COST_HEADING_HTML = '<div style="font-size: 1.05rem; font-weight: 600; margin-bottom: 0.5rem;{extra}">{title}</div>'
+
+# Cost rows: (cost input, unit input or None), each input as (label, key, min, max, help)
+_COST_GROUPS = (
+    (_COST_HEADING_HTML.format(title="Enforcement Costs", extra=""), (
+        (("Private Audit ($/unit)", "cost_audit_priv", 1000, 50000, "Cost per 1% private audit rate."),
+         ("Unit Size (%)", "unit_audit_priv", 0.1, 10.0, "Unit size for private audit rate.")),
+        (("Business Audit ($/unit)", "cost_audit_biz", 1000, 50000, "Cost per 1% business audit rate."),
+         ("Unit Size (%)", "unit_audit_biz", 0.1, 10.0, "Unit size for business audit rate.")),
+        (("Deep Audit ($/unit)", "cost_audit_deep", 500, 20000, "Cost per 10% deep audit probability."),
+         ("Unit Size (%)", "unit_audit_deep", 1.0, 50.0, "Unit size for deep audit probability.")),
+    )),
+    (_COST_HEADING_HTML.format(title="Intervention Costs", extra=" margin-top: 1rem;"), (
+        (("Letters ($/unit)", "cost_letter", 100, 5000, "Cost per 1% letter rate."),
+         ("Unit Size (%)", "unit_letter", 0.1, 10.0, "Unit size for letter rate.")),
+        (("Phone Calls ($/unit)", "cost_phone", 500, 10000, "Cost per 1% phone call rate."),
+         ("Unit Size (%)", "unit_phone", 0.1, 10.0, "Unit size for phone call rate.")),
+    )),
+    (_COST_HEADING_HTML.format(title="Service Costs", extra=" margin-top: 1rem;"), (
+        (("Call Satisfaction ($/unit)", "cost_call_sat", 50, 2000, "Cost per 1% call satisfaction (above 50%)."),
+         ("Unit Size (%)", "unit_call_sat", 0.1, 10.0, "Unit size for call satisfaction.")),
+        (("Web Quality ($/unit)", "cost_web", 50, 2000, "Cost per 0.1 web quality (above 2.0)."),
+         ("Unit Size (score)", "unit_web", 0.05, 1.0, "Unit size for web quality improvement.")),
+        (("HUBA (Flat Cost)", "cost_huba", 1000, 50000, "One-time cost to enable HUBA program."), None),
+    )),
+)
+
+
+def _render_cost_rows(rows):
+    """Render one group of cost/unit-size input pairs in the budget cost configuration."""
+    with st.container():
+        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
+        for cost, unit in rows:
+            c_cost, c_unit = st.columns(2)
+            for col, spec in ((c_cost, cost), (c_unit, unit)):
+                if spec is None:
+                    continue
+                label, key, min_v, max_v, help_text = spec
+                with col: compact_text_input(label, key, DEFAULT_VALUES[key], min_v, max_v, help_text=help_text)
+
+
+# =====================================================
+# SELF-CONTAINED SECTIONS (FRAGMENTS)
+# =====================================================
+# Widgets in these sections feed nothing else on the page, so an interaction
+# inside one reruns only that section. Audits, Interventions and Services stay
+# in render(): the budget meter sums their spend on every rerun.
+
+@st.fragment
+def _render_setup_section():
+    """Population, duration and Monte Carlo run sliders."""
+    with st.expander("Simulation Setup", expanded=True):
+        st.markdown("**Population**", help="Total number of agents in the simulation.")
+        synced_slider_input(
+            label="Population Size", key="pop_slider",
+            min_value=500, max_value=10000,
+            default=DEFAULT_VALUES["pop_value"],
+            step=50, input_max=100000
+        )
+
+        st.markdown("**Simulation Duration (Years)**", help="Number of time steps (years) to simulate.")
+        synced_slider_input(
+            label="Duration", key="dur_slider",
+            min_value=10, max_value=100,
+            default=DEFAULT_VALUES["dur_value"],
+            step=5, input_max=1000
+        )
+
+        st.markdown("**Monte Carlo Runs**", help="Number of independent simulation runs to average results over.")
+        synced_slider_input(
+            label="Runs", key="run_slider",
+            min_value=1, max_value=10,
+            default=DEFAULT_VALUES["run_value"],
+            step=1
+        )
+
+
+@st.fragment
+def _render_fiscal_section():
+    """Tax rate, penalty multiplier and SME population ratio."""
+    with st.expander("Fiscal Environment", expanded=False):
+        st.markdown("**Fiscal Policy**")
+        st.markdown("General Tax Rate (%)", help="Standard tax rate applied to all agent income.")
+        synced_slider_input(
+            "Tax Rate (%)", "tax_slider",
+            10, 60, DEFAULT_VALUES["tax_rate_value"], 5
+        )
+        st.markdown("Penalty Multiplier (x)", help="Fine amount multiplier relative to the evaded tax amount.")
+        synced_slider_input(
+            "Penalty (x)", "penalty_slider",
+            1.0, 5.0, DEFAULT_VALUES["penalty_value"], 0.5, format_str="%.1f"
+        )
+        st.markdown("SME Population Ratio (%)", help="Percentage of total population that are small/medium enterprises. 17.9% derived from Tax Authority Jaar Reportage 2024.")
+        synced_slider_input(
+            "SME Ratio (%)", "biz_ratio_slider",
+            0.0, 100.0, DEFAULT_VALUES["biz_ratio_value"], 1.0, format_str="%.1f"
+        )
+
+
+@st.fragment
+def _render_behaviour_section(show_expert: bool):
+    """Compliance thresholds with projected honesty, plus expert trait rows."""
+    with st.expander("Agent Behaviour", expanded=False):
+         st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">Compliance Thresholds (TCI)</div>', unsafe_allow_html=True, help="Tax Compliance Intention (TCI)")
+         st.markdown("Private Compliance Threshold", help="Tax Compliance Inclination (TCI) required for private agents to comply.")
+         synced_slider_input("Priv Threshold", "tci_threshold_priv_slider", 1.0, 5.0, DEFAULT_VALUES["tci_threshold_priv"], 0.1)
+
+         # Calculate and display Private Compliance %
+         try:
+             p_mean = _cfg.behaviors["compliance_inclination"]["private"]["mean"]
+             p_std = _cfg.behaviors["compliance_inclination"]["private"]["std"]
+             p_thresh = st.session_state.get("tci_threshold_priv_slider", DEFAULT_VALUES["tci_threshold_priv"])
+             st.caption(_honesty_caption(p_thresh, p_mean, p_std))
+         except KeyError:
+             pass
+
+         st.markdown("Business Compliance Threshold", help="Tax Compliance Inclination (TCI) required for business agents to comply.")
+         synced_slider_input("Biz Threshold", "tci_threshold_biz_slider", 1.0, 5.0, DEFAULT_VALUES["tci_threshold_biz"], 0.1)
+
+         # Calculate and display Business Compliance %
+         try:
+             b_mean = _cfg.behaviors["compliance_inclination"]["business"]["mean"]
+             b_std = _cfg.behaviors["compliance_inclination"]["business"]["std"]
+             b_thresh = st.session_state.get("tci_threshold_biz_slider", DEFAULT_VALUES["tci_threshold_biz"])
+             st.caption(_honesty_caption(b_thresh, b_mean, b_std))
+         except KeyError:
+             pass
+
+         if show_expert:
+            st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem; margin-top: 1.5rem;">Trait Configuration</div>', unsafe_allow_html=True)
+
+            # --- Private Agents ---
+            with st.expander("Private Agent Traits", expanded=False):
+                _render_trait_rows("priv")
+
+            # --- Business Agents ---
+            with st.expander("Business Agent Traits", expanded=False):
+                _render_trait_rows("biz")
+
+
+@st.fragment
+def _render_network_section():
+    """Network structure and belief dynamics (expert only)."""
+    with st.expander("Network & Beliefs", expanded=False):
+        st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">Network Structure</div>', unsafe_allow_html=True)
+        # Wrapped container for CSS targeting of these specific rows
+        with st.container():
+             st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
+             c1, c2 = st.columns(2)
+             with c1: compact_text_input("Social Influence Weight", "soc_inf_slider", DEFAULT_VALUES["social_influence_value"], 0.0, 1.0, help_text="How strongly agents are influenced by their neighbors' behavior.")
+             with c2: compact_text_input("Network Homophily", "net_homo", DEFAULT_VALUES["homophily_value"], 0.0, 1.0, help_text="0 = Random mixing, 1 = Complete segregation by type.")
+
+             c3, c4 = st.columns(2)
+             with c3: compact_text_input("Avg. Network Degree", "net_deg", DEFAULT_VALUES["degree_mean_value"], 5.0, 300.0, help_text="Average number of connections per agent.")
+             with c4: compact_text_input("Degree Std.", "net_std", DEFAULT_VALUES["degree_std_value"], 0.0, 300.0, help_text="Standard deviation of the network degree distribution.")
+
+        st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem; margin-top: 1rem;">Belief Dynamics</div>', unsafe_allow_html=True)
+        with st.container():
+            st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
+            b1, b2 = st.columns(2)
+            with b1: compact_text_input("Prior Belief Weight (μ)", "belief_mu", DEFAULT_VALUES["belief_mu"], 0.0, 1.0, help_text="Weight assigned to prior beliefs vs. new information.")
+            with b2: compact_text_input("Audit Signal Strength", "belief_signal", DEFAULT_VALUES["belief_signal"], 0.0, 100.0, help_text="Impact of a neighbor's audit outcome on the agent's belief.")
+
+            b3, b4 = st.columns(2)
+            with b3: compact_text_input("Perception Weight", "belief_perception", DEFAULT_VALUES["belief_perception"], 0.0, 1.0, help_text="Weight of subjective perception regarding neighbors' audit status.")
+            with b4: compact_text_input("Belief Drift Rate", "belief_drift", DEFAULT_VALUES["belief_drift"], 0.0, 1.0, help_text="Rate at which beliefs drift back to the agent's initial baseline.")
+
+
+@st.fragment
+def _render_sme_section():
+    """SME opportunity model and risk adjustments (expert only)."""
+    with st.expander("SME Opportunities", expanded=False):
+        # Opportunity Model
+        st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">SME Opportunities</div>', unsafe_allow_html=True)
+        st.markdown("Base Opportunity Prob.", help="Baseline probability that an SME has the opportunity to evade.")
+        synced_slider_input(
+            "Base Prob", "sme_opp_base_slider", 
+            0.0, 1.0, DEFAULT_VALUES["sme_opp_base_slider"], 0.05, format_str="%.2f",
+        )
+
+        with st.container():
+            st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
+            op2, op3 = st.columns(2)
+            with op2: compact_text_input("Minimum Opportunity", "sme_opp_min", DEFAULT_VALUES["sme_opp_min"], 0.0, 1.0)
+            with op3: compact_text_input("Maximum Opportunity", "sme_opp_max", DEFAULT_VALUES["sme_opp_max"], 0.0, 1.0)
+
+            op4, op5 = st.columns(2)
+            with op4: compact_text_input("Cash Bonus", "sme_opp_cash", DEFAULT_VALUES["sme_opp_cash"], 0.0, 1.0)
+            with op5: compact_text_input("Low Digital Bonus", "sme_opp_digi_low", DEFAULT_VALUES["sme_opp_digi_low"], 0.0, 1.0)
+
+        with st.expander("Opportunity Adjustments", expanded=False):
+            with st.container():
+                st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
+                d1, d2 = st.columns(2)
+                with d1: compact_text_input("Sector Delta (Δ)", "delta_sector", DEFAULT_VALUES["delta_sector_value"], 0.0, 0.5)
+                with d2: compact_text_input("High Digital Delta (Δ)", "delta_digi_high", DEFAULT_VALUES["delta_digi_high_value"], -0.5, 0.0)
+
+                d3, d4 = st.columns(2)
+                with d3: compact_text_input("Cash Intensive Delta (Δ)", "delta_cash", DEFAULT_VALUES["delta_cash_value"], 0.0, 0.5)
+                with d4: compact_text_input("Advisor Delta (Δ)", "delta_advisor", DEFAULT_VALUES["delta_advisor_value"], -0.5, 0.0)
+
+                d5, d6 = st.columns(2)
+                with d5: compact_text_input("Past Audit Delta (Δ)", "delta_audit", DEFAULT_VALUES["delta_audit_value"], -0.5, 0.0)
+                with d6: compact_text_input("Base Risk Factor", "risk_base", DEFAULT_VALUES["risk_base_value"], 0.0, 1.0)
+
+
+@st.fragment
+def _render_error_section():
+    """Unintentional reporting error model (expert only)."""
+    with st.expander("Compliance Errors", expanded=False):
+        # DEBUG: Verify default is loading correctly
+        # st.caption(f"Debug: Default is {DEFAULT_VALUES['error_enabled']}")
+
+        st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">Reporting Errors (Unintentional)</div>', unsafe_allow_html=True)
+
+        # State is seeded from DEFAULT_VALUES at the top of render(), so the key alone drives the toggle
+        if st.toggle("Enable Error Model", key="error_enabled"):
+            with st.container():
+                st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
+                st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">Error Calibration</div>', unsafe_allow_html=True)
+                c_err_1, c_err_2 = st.columns(2)
+                with c_err_1: compact_text_input("Private Error Rate (%)", "error_rate_priv", DEFAULT_VALUES["error_rate_priv"], 0.0, 10.0, help_text="Prob. that a private agent makes an unintentional error.")
+                with c_err_2: compact_text_input("Business Error Rate (%)", "error_rate_biz", DEFAULT_VALUES["error_rate_biz"], 0.0, 50.0, help_text="Prob. that a business agent makes an unintentional error.")
+
+                c_mag = st.columns(2)
+                with c_mag[0]: compact_text_input("Min. Magnitude (%)", "error_mag_min", DEFAULT_VALUES["error_mag_min"], 0.1, 100.0, help_text="Minimum error size as % of income.")
+                with c_mag[1]: compact_text_input("Max. Magnitude (%)", "error_mag_max", DEFAULT_VALUES["error_mag_max"], 0.1, 100.0, help_text="Maximum error size as % of income.")
+
+                c_err_3, _ = st.columns(2)
+                with c_err_3: compact_text_input("Under-reporting Prob. (%)", "error_under_prob", DEFAULT_VALUES["error_under_prob"], 0.0, 100.0, help_text="Conditional prob. that an error results in under-reporting.")
+
+
 def render():
 
 
     """Render the simulation configuration page with tiered settings."""
+    # Patch for nested expanders, applied on first visit rather than when app.py imports every page
+    import streamlit_nested_layout  # noqa: F401
     
     # =====================================================
     # INTEGRITY CHECK: GLOBAL STATE INITIALIZATION
     # =====================================================
     # Ensure all parameters (including hidden expert ones) are initialized
     # This prevents state loss when toggling visibility (e.g. error model, SME sliders)
-    for k, v in DEFAULT_VALUES.items():
-        if k not in st.session_state:
-            st.session_state[k] = v
+    # Seeded with one key-set difference and a single update rather than a lookup per key
+    missing = DEFAULT_VALUES.keys() - st.session_state.keys()
+    if missing:
+        st.session_state.update({k: DEFAULT_VALUES[k] for k in missing})
             
-    # =====================================================
-    # APPLY PENDING CONFIG (must happen BEFORE widgets render)
-    # =====================================================
-    if "_pending_config" in st.session_state:
-        config_data = st.session_state.pop("_pending_config")
-        config_name = st.session_state.pop("_pending_config_name", "config")
-        _apply_config_to_state(config_data)
-        st.toast(f"Loaded: {config_name}")
-    
     # Create centered content area
-    left_spacer, content, right_spacer = st.columns([1, 4, 1])
+    _, content, _ = st.columns(_PAGE_COLS)
     
     with content:
         # Page header
-        header_col, download_col, reset_col = st.columns([4, 1.2, 1])
+        header_col, download_col, reset_col = st.columns(_HEADER_COLS)
         
         with header_col:
-            st.markdown("""
-                <div style="display:flex; align-items:baseline; gap:16px; padding-top: 10px; margin-bottom: 0px;">
-                    <span style="font-size: 28px; font-weight: 700; color: #1A1A1A;">
-                        Configure Simulation
-                    </span>
-                    <span style="font-size: 14px; color: #718096;">
-                        Adjust parameters and run
-                    </span>
-                </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
         with download_col:
             from dashboard.utils.ui import render_download_button
             render_download_button()
             
         with reset_col:
-            if st.button("Reset Defaults", use_container_width=True, key="btn_reset_header"):
-                reset_to_defaults()
-                st.rerun()
+            st.button("Reset Defaults", use_container_width=True, key="btn_reset_header", on_click=reset_to_defaults)
         
         # Horizontal separator
-        st.markdown('<div style="border-bottom:1px solid #D1D9E0; margin-bottom:12px; margin-top:-12px;"></div>', unsafe_allow_html=True)
+        st.markdown(_HEADER_SEPARATOR_HTML, unsafe_allow_html=True)
         
         # EXPERT MODE TOGGLE
         show_expert = st.toggle("Show Expert Settings", key="show_expert_settings", help="Reveal advanced calibration parameters for beliefs, networks, and compliance models.")
@@ -622,50 +936,18 @@ def render():
             st.session_state.last_show_expert = show_expert
             force_slider_visual_sync()
         
-        st.markdown("<div style='height: 12px'></div>", unsafe_allow_html=True)
+        st.markdown(_SPACER_HTML, unsafe_allow_html=True)
 
         # =====================================================
         # 1. SETUP - Always Visible
         # =====================================================
-        
-        # Initialize session state for synced values
-        if "pop_value" not in st.session_state:
-            reset_to_defaults()
-
-        with st.expander("Simulation Setup", expanded=True):
-            st.markdown("**Population**", help="Total number of agents in the simulation.")
-            n_agents = synced_slider_input(
-                label="Population Size", key="pop_slider",
-                min_value=500, max_value=10000,
-                default=DEFAULT_VALUES["pop_value"],
-                step=50, input_max=100000
-            )
-            
-            st.markdown("**Simulation Duration (Years)**", help="Number of time steps (years) to simulate.")
-            n_steps = synced_slider_input(
-                label="Duration", key="dur_slider",
-                min_value=10, max_value=100,
-                default=DEFAULT_VALUES["dur_value"],
-                step=5, input_max=1000
-            )
-            
-            st.markdown("**Monte Carlo Runs**", help="Number of independent simulation runs to average results over.")
-            n_runs = synced_slider_input(
-                label="Runs", key="run_slider",
-                min_value=1, max_value=10,
-                default=DEFAULT_VALUES["run_value"],
-                step=1
-            )
+
+        _render_setup_section()
 
         # =====================================================
         # 2. STRATEGY - ENFORCEMENT
         # =====================================================
-        st.markdown("""
-            <div style="margin-top: 32px; margin-bottom: 12px;">
-                <span style="font-size: 18px; font-weight: 600; color: #1A1A1A;">Tax Authority Strategy</span>
-                <div style="border-bottom: 1px solid #D1D9E0; margin-top: 8px;"></div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_STRATEGY_HEADING_HTML, unsafe_allow_html=True)
         
         # BUDGET MODE TOGGLE
         budget_mode = st.toggle("Budget Mode", key="budget_mode", help="Enable budget-constrained allocation. Control spending instead of direct parameters.")
@@ -690,45 +972,9 @@ def render():
                 
                 # Cost Configuration (Nested Expander)
                 with st.expander("Cost Configuration", expanded=False):
-                    st.markdown('<div style="font-size: 1.05rem; font-weight: 600; margin-bottom: 0.5rem;">Enforcement Costs</div>', unsafe_allow_html=True)
-                    with st.container():
-                        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                        c1, c2 = st.columns(2)
-                        with c1: compact_text_input("Private Audit ($/unit)", "cost_audit_priv", DEFAULT_VALUES["cost_audit_priv"], 1000, 50000, help_text="Cost per 1% private audit rate.")
-                        with c2: compact_text_input("Unit Size (%)", "unit_audit_priv", DEFAULT_VALUES["unit_audit_priv"], 0.1, 10.0, help_text="Unit size for private audit rate.")
-                        
-                        c3, c4 = st.columns(2)
-                        with c3: compact_text_input("Business Audit ($/unit)", "cost_audit_biz", DEFAULT_VALUES["cost_audit_biz"], 1000, 50000, help_text="Cost per 1% business audit rate.")
-                        with c4: compact_text_input("Unit Size (%)", "unit_audit_biz", DEFAULT_VALUES["unit_audit_biz"], 0.1, 10.0, help_text="Unit size for business audit rate.")
-                        
-                        c5, c6 = st.columns(2)
-                        with c5: compact_text_input("Deep Audit ($/unit)", "cost_audit_deep", DEFAULT_VALUES["cost_audit_deep"], 500, 20000, help_text="Cost per 10% deep audit probability.")
-                        with c6: compact_text_input("Unit Size (%)", "unit_audit_deep", DEFAULT_VALUES["unit_audit_deep"], 1.0, 50.0, help_text="Unit size for deep audit probability.")
-                    
-                    st.markdown('<div style="font-size: 1.05rem; font-weight: 600; margin-bottom: 0.5rem; margin-top: 1rem;">Intervention Costs</div>', unsafe_allow_html=True)
-                    with st.container():
-                        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                        c7, c8 = st.columns(2)
-                        with c7: compact_text_input("Letters ($/unit)", "cost_letter", DEFAULT_VALUES["cost_letter"], 100, 5000, help_text="Cost per 1% letter rate.")
-                        with c8: compact_text_input("Unit Size (%)", "unit_letter", DEFAULT_VALUES["unit_letter"], 0.1, 10.0, help_text="Unit size for letter rate.")
-                        
-                        c9, c10 = st.columns(2)
-                        with c9: compact_text_input("Phone Calls ($/unit)", "cost_phone", DEFAULT_VALUES["cost_phone"], 500, 10000, help_text="Cost per 1% phone call rate.")
-                        with c10: compact_text_input("Unit Size (%)", "unit_phone", DEFAULT_VALUES["unit_phone"], 0.1, 10.0, help_text="Unit size for phone call rate.")
-                    
-                    st.markdown('<div style="font-size: 1.05rem; font-weight: 600; margin-bottom: 0.5rem; margin-top: 1rem;">Service Costs</div>', unsafe_allow_html=True)
-                    with st.container():
-                        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                        c11, c12 = st.columns(2)
-                        with c11: compact_text_input("Call Satisfaction ($/unit)", "cost_call_sat", DEFAULT_VALUES["cost_call_sat"], 50, 2000, help_text="Cost per 1% call satisfaction (above 50%).")
-                        with c12: compact_text_input("Unit Size (%)", "unit_call_sat", DEFAULT_VALUES["unit_call_sat"], 0.1, 10.0, help_text="Unit size for call satisfaction.")
-                        
-                        c13, c14 = st.columns(2)
-                        with c13: compact_text_input("Web Quality ($/unit)", "cost_web", DEFAULT_VALUES["cost_web"], 50, 2000, help_text="Cost per 0.1 web quality (above 2.0).")
-                        with c14: compact_text_input("Unit Size (score)", "unit_web", DEFAULT_VALUES["unit_web"], 0.05, 1.0, help_text="Unit size for web quality improvement.")
-                        
-                        c15, _ = st.columns(2)
-                        with c15: compact_text_input("HUBA (Flat Cost)", "cost_huba", DEFAULT_VALUES["cost_huba"], 1000, 50000, help_text="One-time cost to enable HUBA program.")
+                    for heading_html, rows in _COST_GROUPS:
+                        st.markdown(heading_html, unsafe_allow_html=True)
+                        _render_cost_rows(rows)
                 
                 # Budget Meter - only count enabled interventions
                 letter_enabled = st.session_state.get("letter_enabled", False)
@@ -755,19 +1001,10 @@ def render():
                 
                 meter_color = "#48BB78" if not budget_exceeded else "#F56565"  # Green or Red
                 
-                st.markdown(f"""
-                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 8px 12px; background: #F7FAFC; border-radius: 8px; margin-top: 12px;">
-                        <div>
-                            <span style="font-weight: 600;">Budget:</span> ${total_budget:,}
-                        </div>
-                        <div>
-                            <span style="font-weight: 600;">Allocated:</span> ${total_spent:,.0f}
-                        </div>
-                        <div style="color: {meter_color}; font-weight: 600;">
-                            <span>Remaining:</span> ${remaining:,.0f}
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_BUDGET_METER_HTML.format(
+                    total_budget=total_budget, total_spent=total_spent,
+                    remaining=remaining, meter_color=meter_color,
+                ), unsafe_allow_html=True)
                 
                 if budget_exceeded:
                     st.error("Budget exceeded! Reduce spending to run simulation.")
@@ -838,7 +1075,7 @@ def render():
                 )
 
                 st.markdown("**Deep Audit Probability (%)**")
-                depth = synced_slider_input(
+                synced_slider_input(
                     label="Deep Audit Prob", key="audit_depth_slider",
                     min_value=0.0, max_value=100.0,
                     default=DEFAULT_VALUES["audit_depth_value"],
@@ -848,23 +1085,11 @@ def render():
             
 
             
-            st.markdown("**Audit Selection Strategy**")
-            default_audit = DEFAULT_VALUES["audit_strategy"]
-            if default_audit == "risk_based": default_audit = "risk"
-            
-            audit_display_map = {
-                "random": "Random Selection",
-                "risk": "Risk-Based",
-                "network": "Network Connectivity"
-            }
-            
             st.selectbox(
-                "Audit Selection Strategy",
-                options=["random", "risk", "network"],
-                index=["random", "risk", "network"].index(default_audit) if default_audit in ["random", "risk", "network"] else 0,
-                format_func=lambda x: audit_display_map.get(x, x),
+                "**Audit Selection Strategy**",
+                options=_STRATEGY_OPTIONS,
+                format_func=_AUDIT_STRATEGY_LABELS.__getitem__,
                 key="sel_audit",
-                label_visibility="collapsed"
             )
 
         # =====================================================
@@ -917,10 +1142,9 @@ def render():
                     with st.expander("Optimization (Expert)", expanded=False):
                         st.selectbox(
                             "Selection", 
-                            ["random", "risk", "network"], 
-                            index=0, 
+                            _STRATEGY_OPTIONS, 
                             key="sel_letter_strategy",
-                            format_func=lambda x: {"random": "Random", "risk": "Risk-Based", "network": "Network"}.get(x, x)
+                            format_func=_INTERVENTION_STRATEGY_LABELS.__getitem__
                         )
                         
                         st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem; margin-top: 1rem;">Effects (Change in Belief/Trust)</div>', unsafe_allow_html=True)
@@ -931,7 +1155,7 @@ def render():
                             with l_eff_1: compact_text_input("Permanent Impact (Δ)", "letter_eff_perm", DEFAULT_VALUES["letter_eff_perm"], 0.0, 20.0, help_text="Permanent change in audit probability perception after receiving a letter.")
                             with l_eff_2: compact_text_input("Temporary Impact (Δ)", "letter_eff_temp", DEFAULT_VALUES["letter_eff_temp"], 0.0, 50.0, help_text="Temporary spike in audit probability perception (decays over time).")
                             
-                            l_eff_3, _ = st.columns([1, 1])
+                            l_eff_3, _ = st.columns(2)
                             with l_eff_3: compact_text_input("Trust Impact (Δ)", "letter_eff_trust", DEFAULT_VALUES["letter_eff_trust"], -1.0, 1.0, help_text="Change in trust levels after receiving a letter.")
             
             st.markdown("---")
@@ -981,10 +1205,9 @@ def render():
                     with st.expander("Optimization (Expert)", expanded=False):
                         st.selectbox(
                             "Selection", 
-                            ["random", "risk", "network"], 
-                            index=0, 
+                            _STRATEGY_OPTIONS, 
                             key="sel_phone_strategy",
-                            format_func=lambda x: {"random": "Random", "risk": "Risk-Based", "network": "Network"}.get(x, x)
+                            format_func=_INTERVENTION_STRATEGY_LABELS.__getitem__
                         )
                         
                         st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem; margin-top: 1rem;">Effects (PSO/Trust Impact)</div>', unsafe_allow_html=True)
@@ -994,7 +1217,7 @@ def render():
                             with p_eff_1: compact_text_input("Satisfied Impact (Δ)", "phone_sat_delta", DEFAULT_VALUES["phone_sat_delta"], -1.0, 1.0, help_text="Change in compliance (PSO) if call experience is satisfied.")
                             with p_eff_2: compact_text_input("Dissatisfied Impact (Δ)", "phone_dissat_delta", DEFAULT_VALUES["phone_dissat_delta"], -1.0, 1.0, help_text="Change in compliance (PSO) if call experience is dissatisfied.")
                             
-                            p_eff_3, _ = st.columns([1, 1])
+                            p_eff_3, _ = st.columns(2)
                             with p_eff_3: compact_text_input("Audit Perception Impact (Δ)", "phone_eff_audit_temp", DEFAULT_VALUES["phone_eff_audit_temp"], 0.0, 50.0, help_text="Temporary increase in perceived audit probability after a call.")
 
         # =====================================================
@@ -1047,10 +1270,10 @@ def render():
 
                 # HUBA in budget mode
                 st.markdown("**HUBA Program**", help="One-time cost to launch HUBA transparency program.")
-                huba_enabled = st.toggle("Launch HUBA", key="transparency_toggle", help="Enable High Utility Business Audit (HUBA) program transparency effects.")
+                huba_enabled = st.toggle("Launch HUBA", key="transparency_toggle", help=_HUBA_TOGGLE_HELP)
                 if huba_enabled:
                     st.session_state["spend_huba"] = st.session_state.get("cost_huba", DEFAULT_VALUES["cost_huba"])
-                    st.markdown(f"<div style='color: #718096; font-size: 12px;'>Cost: ${st.session_state['spend_huba']:,}</div>", unsafe_allow_html=True)
+                    st.markdown(_HUBA_COST_HTML.format(cost=st.session_state["spend_huba"]), unsafe_allow_html=True)
                 else:
                     st.session_state["spend_huba"] = 0
             else:
@@ -1073,9 +1296,8 @@ def render():
                 
                 if show_expert:
                     st.markdown("Transparency (HUBA)")
-                    st.toggle("Launch HUBA", key="transparency_toggle", help="Enable High Utility Business Audit (HUBA) program transparency effects.")
-                    if st.session_state["transparency_toggle"]:
-                        h_col, _ = st.columns([1, 1])
+                    if st.toggle("Launch HUBA", key="transparency_toggle", help=_HUBA_TOGGLE_HELP):
+                        h_col, _ = st.columns(2)
                         with h_col: compact_text_input("HUBA Impact (Δ)", "huba_delta", DEFAULT_VALUES["huba_delta"], 0.0, 5.0, help_text="Increase in trust/compliance due to HUBA transparency.")
 
 
@@ -1083,827 +1305,649 @@ def render():
         # =====================================================
         # 5. ALGORITHM CONFIGURATION
         # =====================================================
-        st.markdown("""
-            <div style="margin-top: 32px; margin-bottom: 12px;">
-                <span style="font-size: 18px; font-weight: 600; color: #1A1A1A;">Algorithm Configuration</span>
-                <div style="border-bottom: 1px solid #D1D9E0; margin-top: 8px;"></div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_ALGORITHM_HEADING_HTML, unsafe_allow_html=True)
 
         # --- Fiscal Environment (Moved here) ---
-        with st.expander("Fiscal Environment", expanded=False):
-            st.markdown("**Fiscal Policy**")
-            st.markdown("General Tax Rate (%)", help="Standard tax rate applied to all agent income.")
-            synced_slider_input(
-                "Tax Rate (%)", "tax_slider",
-                10, 60, DEFAULT_VALUES["tax_rate_value"], 5
-            )
-            st.markdown("Penalty Multiplier (x)", help="Fine amount multiplier relative to the evaded tax amount.")
-            synced_slider_input(
-                "Penalty (x)", "penalty_slider",
-                1.0, 5.0, DEFAULT_VALUES["penalty_value"], 0.5, format_str="%.1f"
-            )
-            st.markdown("SME Population Ratio (%)", help="Percentage of total population that are small/medium enterprises. 17.9% derived from Tax Authority Jaar Reportage 2024.")
-            synced_slider_input(
-                "SME Ratio (%)", "biz_ratio_slider",
-                0.0, 100.0, DEFAULT_VALUES["biz_ratio_value"], 1.0, format_str="%.1f"
-            )
+        _render_fiscal_section()
 
         # --- Agent Behaviour (Was Compliance Thresholds) ---
-        with st.expander("Agent Behaviour", expanded=False):
-             st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">Compliance Thresholds (TCI)</div>', unsafe_allow_html=True, help="Tax Compliance Intention (TCI)")
-             st.markdown("Private Compliance Threshold", help="Tax Compliance Inclination (TCI) required for private agents to comply.")
-             synced_slider_input("Priv Threshold", "tci_threshold_priv_slider", 1.0, 5.0, DEFAULT_VALUES["tci_threshold_priv"], 0.1)
-             
-             # Calculate and display Private Compliance %
-             try:
-                 p_mean = _cfg.behaviors["compliance_inclination"]["private"]["mean"]
-                 p_std = _cfg.behaviors["compliance_inclination"]["private"]["std"]
-                 p_thresh = st.session_state.get("tci_threshold_priv_slider", DEFAULT_VALUES["tci_threshold_priv"])
-                 p_honest_pct = norm.sf(p_thresh, loc=p_mean, scale=p_std) * 100
-                 st.caption(f"Projected Honesty: {p_honest_pct:.1f}% with N(μ={p_mean}, σ={p_std})")
-             except KeyError:
-                 pass
-
-             st.markdown("Business Compliance Threshold", help="Tax Compliance Inclination (TCI) required for business agents to comply.")
-             synced_slider_input("Biz Threshold", "tci_threshold_biz_slider", 1.0, 5.0, DEFAULT_VALUES["tci_threshold_biz"], 0.1)
-             
-             # Calculate and display Business Compliance %
-             try:
-                 b_mean = _cfg.behaviors["compliance_inclination"]["business"]["mean"]
-                 b_std = _cfg.behaviors["compliance_inclination"]["business"]["std"]
-                 b_thresh = st.session_state.get("tci_threshold_biz_slider", DEFAULT_VALUES["tci_threshold_biz"])
-                 b_honest_pct = norm.sf(b_thresh, loc=b_mean, scale=b_std) * 100
-                 st.caption(f"Projected Honesty: {b_honest_pct:.1f}% with N(μ={b_mean}, σ={b_std})")
-             except KeyError:
-                 pass
-
-             if show_expert:
-                st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem; margin-top: 1.5rem;">Trait Configuration</div>', unsafe_allow_html=True)
-                
-                # --- Private Agents ---
-                with st.expander("Private Agent Traits", expanded=False):
-                        
-                    # Subjective Audit Probability
-                    with st.container():
-                        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                        c1, c2 = st.columns(2)
-                        with c1: compact_text_input("Subj. Audit Prob. Mean (μ)", "priv_audit_mean", DEFAULT_VALUES["priv_audit_belief_value"], 0.0, 100.0, help_text="Perceived probability of being audited (0-100%).")
-                        with c2: compact_text_input("Subj. Audit Prob. Std. (σ)", "priv_audit_std", DEFAULT_VALUES["priv_audit_belief_std"], 0.0, 50.0)
-
-                        # Personal Norms
-                        c3, c4 = st.columns(2)
-                        with c3: compact_text_input("Personal Norms Mean (μ)", "priv_pn_mean", DEFAULT_VALUES["priv_pn_value"], 1.0, 5.0)
-                        with c4: compact_text_input("Personal Norms Std. (σ)", "priv_pn_std", DEFAULT_VALUES["priv_pn_std"], 0.0, 2.0)
-
-                        # Social Norms
-                        c5, c6 = st.columns(2)
-                        with c5: compact_text_input("Social Norms Mean (μ)", "priv_sn_mean", DEFAULT_VALUES["priv_sn_value"], 1.0, 5.0)
-                        with c6: compact_text_input("Social Norms Std. (σ)", "priv_sn_std", DEFAULT_VALUES["priv_sn_std"], 0.0, 2.0)
-                        
-                        # Societal Norms 
-                        c7, c8 = st.columns(2)
-                        with c7: compact_text_input("Societal Norms Mean (μ)", "priv_stn_mean", DEFAULT_VALUES["priv_stn_value"], 1.0, 5.0)
-                        with c8: compact_text_input("Societal Norms Std. (σ)", "priv_stn_std", DEFAULT_VALUES["priv_stn_std"], 0.0, 2.0)
-
-                        # PSO
-                        c9, c10 = st.columns(2)
-                        with c9: compact_text_input("Perceived Service (PSO) Mean (μ)", "priv_pso_mean", DEFAULT_VALUES["priv_pso_value"], 1.0, 5.0)
-                        with c10: compact_text_input("Perceived Service (PSO) Std. (σ)", "priv_pso_std", DEFAULT_VALUES["priv_pso_std"], 0.0, 2.0)
-
-                        # Trust
-                        c11, c12 = st.columns(2)
-                        with c11: compact_text_input("Trust Baseline Mean (μ)", "priv_pt_mean", DEFAULT_VALUES["priv_pt_value"], 1.0, 5.0)
-                        with c12: compact_text_input("Trust Baseline Std. (σ)", "priv_pt_std", DEFAULT_VALUES["priv_pt_std"], 0.0, 2.0)
-
-
-                # --- Business Agents ---
-                with st.expander("Business Agent Traits", expanded=False):
-
-                    # Subjective Audit Probability
-                    with st.container():
-                        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                        bc1, bc2 = st.columns(2)
-                        with bc1: compact_text_input("Subj. Audit Prob. Mean (μ)", "biz_audit_mean", DEFAULT_VALUES["biz_audit_belief_value"], 0.0, 100.0, help_text="Perceived probability of being audited (0-100%).")
-                        with bc2: compact_text_input("Subj. Audit Prob. Std. (σ)", "biz_audit_std", DEFAULT_VALUES["biz_audit_belief_std"], 0.0, 50.0)
-
-                        # Personal Norms
-                        bc3, bc4 = st.columns(2)
-                        with bc3: compact_text_input("Business Norms Mean (μ)", "biz_pn_mean", DEFAULT_VALUES["biz_pn_value"], 1.0, 5.0)
-                        with bc4: compact_text_input("Business Norms Std. (σ)", "biz_pn_std", DEFAULT_VALUES["biz_pn_std"], 0.0, 2.0)
-
-                        # Social Norms
-                        bc5, bc6 = st.columns(2)
-                        with bc5: compact_text_input("Social Norms Mean (μ)", "biz_sn_mean", DEFAULT_VALUES["biz_sn_value"], 1.0, 5.0)
-                        with bc6: compact_text_input("Social Norms Std. (σ)", "biz_sn_std", DEFAULT_VALUES["biz_sn_std"], 0.0, 2.0)
-                        
-                        # Societal Norms 
-                        bc7, bc8 = st.columns(2)
-                        with bc7: compact_text_input("Societal Norms Mean (μ)", "biz_stn_mean", DEFAULT_VALUES["biz_stn_value"], 1.0, 5.0)
-                        with bc8: compact_text_input("Societal Norms Std. (σ)", "biz_stn_std", DEFAULT_VALUES["biz_stn_std"], 0.0, 2.0)
-
-                        # PSO
-                        bc9, bc10 = st.columns(2)
-                        with bc9: compact_text_input("Perceived Service (PSO) Mean (μ)", "biz_pso_mean", DEFAULT_VALUES["biz_pso_value"], 1.0, 5.0)
-                        with bc10: compact_text_input("Perceived Service (PSO) Std. (σ)", "biz_pso_std", DEFAULT_VALUES["biz_pso_std"], 0.0, 2.0)
-
-                        # Trust
-                        bc11, bc12 = st.columns(2)
-                        with bc11: compact_text_input("Trust Baseline Mean (μ)", "biz_pt_mean", DEFAULT_VALUES["biz_pt_value"], 1.0, 5.0)
-                        with bc12: compact_text_input("Trust Baseline Std. (σ)", "biz_pt_std", DEFAULT_VALUES["biz_pt_std"], 0.0, 2.0)
+        _render_behaviour_section(show_expert)
 
         # --- Conditional Expert Settings ---
         if show_expert:
             
             # --- Network & Social Dynamics ---
             # --- Network & Social Dynamics ---
-            with st.expander("Network & Beliefs", expanded=False):
-                st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">Network Structure</div>', unsafe_allow_html=True)
-                # Wrapped container for CSS targeting of these specific rows
-                with st.container():
-                     st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                     c1, c2 = st.columns(2)
-                     with c1: compact_text_input("Social Influence Weight", "soc_inf_slider", DEFAULT_VALUES["social_influence_value"], 0.0, 1.0, help_text="How strongly agents are influenced by their neighbors' behavior.")
-                     with c2: compact_text_input("Network Homophily", "net_homo", DEFAULT_VALUES["homophily_value"], 0.0, 1.0, help_text="0 = Random mixing, 1 = Complete segregation by type.")
-                     
-                     c3, c4 = st.columns(2)
-                     with c3: compact_text_input("Avg. Network Degree", "net_deg", DEFAULT_VALUES["degree_mean_value"], 5.0, 300.0, help_text="Average number of connections per agent.")
-                     with c4: compact_text_input("Degree Std.", "net_std", DEFAULT_VALUES["degree_std_value"], 0.0, 300.0, help_text="Standard deviation of the network degree distribution.")
-                    
-                st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem; margin-top: 1rem;">Belief Dynamics</div>', unsafe_allow_html=True)
-                with st.container():
-                    st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                    b1, b2 = st.columns(2)
-                    with b1: compact_text_input("Prior Belief Weight (μ)", "belief_mu", DEFAULT_VALUES["belief_mu"], 0.0, 1.0, help_text="Weight assigned to prior beliefs vs. new information.")
-                    with b2: compact_text_input("Audit Signal Strength", "belief_signal", DEFAULT_VALUES["belief_signal"], 0.0, 100.0, help_text="Impact of a neighbor's audit outcome on the agent's belief.")
-                    
-                    b3, b4 = st.columns(2)
-                    with b3: compact_text_input("Perception Weight", "belief_perception", DEFAULT_VALUES["belief_perception"], 0.0, 1.0, help_text="Weight of subjective perception regarding neighbors' audit status.")
-                    with b4: compact_text_input("Belief Drift Rate", "belief_drift", DEFAULT_VALUES["belief_drift"], 0.0, 1.0, help_text="Rate at which beliefs drift back to the agent's initial baseline.")
-
+            _render_network_section()
 
-                
             # --- SME Specifics ---
-            with st.expander("SME Opportunities", expanded=False):
-                # Opportunity Model
-                st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">SME Opportunities</div>', unsafe_allow_html=True)
-                st.markdown("Base Opportunity Prob.", help="Baseline probability that an SME has the opportunity to evade.")
-                synced_slider_input(
-                    "Base Prob", "sme_opp_base_slider", 
-                    0.0, 1.0, DEFAULT_VALUES["sme_opp_base_slider"], 0.05, format_str="%.2f",
-                )
-                
-                with st.container():
-                    st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                    op2, op3 = st.columns(2)
-                    with op2: compact_text_input("Minimum Opportunity", "sme_opp_min", DEFAULT_VALUES["sme_opp_min"], 0.0, 1.0)
-                    with op3: compact_text_input("Maximum Opportunity", "sme_opp_max", DEFAULT_VALUES["sme_opp_max"], 0.0, 1.0)
-                    
-                    op4, op5 = st.columns(2)
-                    with op4: compact_text_input("Cash Bonus", "sme_opp_cash", DEFAULT_VALUES["sme_opp_cash"], 0.0, 1.0)
-                    with op5: compact_text_input("Low Digital Bonus", "sme_opp_digi_low", DEFAULT_VALUES["sme_opp_digi_low"], 0.0, 1.0)
-                    
-                with st.expander("Opportunity Adjustments", expanded=False):
-                    with st.container():
-                        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                        d1, d2 = st.columns(2)
-                        with d1: compact_text_input("Sector Delta (Δ)", "delta_sector", DEFAULT_VALUES["delta_sector_value"], 0.0, 0.5)
-                        with d2: compact_text_input("High Digital Delta (Δ)", "delta_digi_high", DEFAULT_VALUES["delta_digi_high_value"], -0.5, 0.0)
-                        
-                        d3, d4 = st.columns(2)
-                        with d3: compact_text_input("Cash Intensive Delta (Δ)", "delta_cash", DEFAULT_VALUES["delta_cash_value"], 0.0, 0.5)
-                        with d4: compact_text_input("Advisor Delta (Δ)", "delta_advisor", DEFAULT_VALUES["delta_advisor_value"], -0.5, 0.0)
-                        
-                        d5, d6 = st.columns(2)
-                        with d5: compact_text_input("Past Audit Delta (Δ)", "delta_audit", DEFAULT_VALUES["delta_audit_value"], -0.5, 0.0)
-                        with d6: compact_text_input("Base Risk Factor", "risk_base", DEFAULT_VALUES["risk_base_value"], 0.0, 1.0)
+            _render_sme_section()
 
             # --- Error Model ---
             # --- Error Model ---
-            with st.expander("Compliance Errors", expanded=False):
-                # DEBUG: Verify default is loading correctly
-                # st.caption(f"Debug: Default is {DEFAULT_VALUES['error_enabled']}")
-                
-                st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">Reporting Errors (Unintentional)</div>', unsafe_allow_html=True)
-                
-                # FORCE VALUE from state to ensure toggle reflects state
-                st.toggle("Enable Error Model", key="error_enabled", value=st.session_state["error_enabled"])
-                if st.session_state["error_enabled"]:
-                    with st.container():
-                        st.markdown('<div class="compact-rows-wrapper"></div>', unsafe_allow_html=True)
-                        st.markdown('<div style="font-size: 1.15rem; font-weight: 600; margin-bottom: 0.5rem;">Error Calibration</div>', unsafe_allow_html=True)
-                        c_err_1, c_err_2 = st.columns(2)
-                        with c_err_1: compact_text_input("Private Error Rate (%)", "error_rate_priv", DEFAULT_VALUES["error_rate_priv"], 0.0, 10.0, help_text="Prob. that a private agent makes an unintentional error.")
-                        with c_err_2: compact_text_input("Business Error Rate (%)", "error_rate_biz", DEFAULT_VALUES["error_rate_biz"], 0.0, 50.0, help_text="Prob. that a business agent makes an unintentional error.")
-                        
-                        c_mag = st.columns(2)
-                        with c_mag[0]: compact_text_input("Min. Magnitude (%)", "error_mag_min", DEFAULT_VALUES["error_mag_min"], 0.1, 100.0, help_text="Minimum error size as % of income.")
-                        with c_mag[1]: compact_text_input("Max. Magnitude (%)", "error_mag_max", DEFAULT_VALUES["error_mag_max"], 0.1, 100.0, help_text="Maximum error size as % of income.")
-
-                        c_err_3, _ = st.columns(2)
-                        with c_err_3: compact_text_input("Under-reporting Prob. (%)", "error_under_prob", DEFAULT_VALUES["error_under_prob"], 0.0, 100.0, help_text="Conditional prob. that an error results in under-reporting.")
+            _render_error_section()
 
 
         # =====================================================
         # ACTION BAR
         # =====================================================
-        st.markdown('<hr style="margin-top: 12px; margin-bottom: 8px; border: none; border-top: 1px solid #D1D9E0;">', unsafe_allow_html=True)
+        st.markdown(_ACTION_BAR_HR_HTML, unsafe_allow_html=True)
         
-        col_load, _, col_start = st.columns([2, 3, 2])
+        col_load, _, col_start = st.columns(_ACTION_BAR_COLS)
         
         with col_load:
             uploaded_config = st.file_uploader(
                 "Load Config",
                 type=["json"],
                 key="config_uploader",
+                on_change=_on_config_upload,
                 label_visibility="collapsed",
                 help="Load a configuration JSON file to populate all settings"
             )
-            if uploaded_config is not None:
-                # Create a unique identifier for this file upload
-                file_id = f"{uploaded_config.name}_{uploaded_config.size}"
-                # Only process if this is a NEW file (not already processed)
-                if st.session_state.get("_last_loaded_config_id") != file_id:
-                    try:
-                        # Parse the uploaded JSON
-                        config_data = json.load(uploaded_config)
-                        # Mark this file as processed
-                        st.session_state["_last_loaded_config_id"] = file_id
-                        # Store in session state - will be applied on next render BEFORE widgets
-                        st.session_state["_pending_config"] = config_data
-                        st.session_state["_pending_config_name"] = uploaded_config.name
-                        # Rerun to apply the config before widgets are instantiated
-                        st.rerun()
-                    except json.JSONDecodeError as e:
-                        st.error(f"Invalid JSON file: {e}")
-                    except Exception as e:
-                        st.error(f"Error loading config: {e}")
+            # The config itself is applied in _on_config_upload, before widgets render
+            if uploaded_config is not None and st.session_state.get("_config_load_error"):
+                st.error(st.session_state["_config_load_error"])
             
             if uploaded_config:
-                 st.markdown(f"<div style='text-align: center; color: #333333; font-size: 14px; margin-top: -10px; font-weight: 500;'>Loaded: {uploaded_config.name}</div>", unsafe_allow_html=True)
+                 st.markdown(_LOADED_CONFIG_HTML.format(name=uploaded_config.name), unsafe_allow_html=True)
 
         with col_start:
             budget_exceeded = st.session_state.get("_budget_exceeded", False)
             
-            if st.button("Start Simulation", type="primary", use_container_width=True, key="btn_start", disabled=budget_exceeded):
-                # Capturing all parameter values from session state for simulation run
-                st.session_state.simulation_params = {
-                    # Simulation core
-                    "n_agents": st.session_state["pop_slider"],
-
-                    "n_steps": st.session_state["dur_slider"],
-                    "n_runs": st.session_state["run_slider"],
-                    "business_ratio": st.session_state["biz_ratio_slider"] / 100.0,
-                    
-                    # Behaviors
-                    "tci_threshold_private": st.session_state["tci_threshold_priv_slider"],
-                    "tci_threshold_business": st.session_state["tci_threshold_biz_slider"],
-
-                    
-                    # Enforcement
-                    "tax_rate": st.session_state["tax_slider"] / 100.0,
-                    "penalty_rate": st.session_state["penalty_slider"],
-                    "audit_strategy": st.session_state["sel_audit"],
-                    "audit_rate_private": st.session_state["priv_audit_slider"] / 100.0,
-                    "audit_rate_business": st.session_state["biz_audit_slider"] / 100.0,
-                    "audit_depth_books": st.session_state["audit_depth_slider"] / 100.0,
-                    
-                    # Interventions
-                    "letter_enabled": st.session_state["letter_enabled"],
-                    "letter_rate_private": st.session_state["letter_rate_priv_slider"] / 100.0,
-                    "letter_rate_business": st.session_state["letter_rate_biz_slider"] / 100.0,
-                    "letter_strategy": st.session_state.get("sel_letter_strategy", "random"),
-                    # Letter Effects
-                    "letter_eff_perm": st.session_state["letter_eff_perm"],
-                    "letter_eff_temp": st.session_state["letter_eff_temp"],
-                    "letter_eff_trust": st.session_state["letter_eff_trust"],
-                    
-                    "phone_enabled": st.session_state["phone_enabled"],
-                    "phone_rate_private": st.session_state["phone_rate_priv_slider"] / 100.0,
-                    "phone_rate_business": st.session_state["phone_rate_biz_slider"] / 100.0,
-                    "phone_strategy": st.session_state.get("sel_phone_strategy", "random"),
-                    # Phone Effects
-                    "phone_sat_delta": st.session_state["phone_sat_delta"],
-                    "phone_dissat_delta": st.session_state["phone_dissat_delta"],
-                    "phone_eff_audit_temp": st.session_state["phone_eff_audit_temp"],
-                    
-                    # Service
-                    "phone_sat": st.session_state["phone_sat_slider"] / 100.0,
-                    "web_qual_private": st.session_state["web_qual_priv_slider"],
-                    "web_qual_business": st.session_state["web_qual_biz_slider"],
-                    "transparency": st.session_state["transparency_toggle"],
-                    "huba_delta": st.session_state["huba_delta"],
-                    
-                    # Network & Social
-                    "homophily": st.session_state["net_homo"],
-                    "degree_mean": st.session_state["net_deg"],
-                    "social_influence": st.session_state["soc_inf_slider"],
-                    
-                    # Belief Dynamics
-                    "belief_mu": st.session_state["belief_mu"],
-                    "belief_drift": st.session_state["belief_drift"], 
-                    "belief_signal": st.session_state["belief_signal"],
-                    "belief_perception": st.session_state["belief_perception"],
-                    "belief_delta": st.session_state["belief_delta"],
-                    "belief_target": st.session_state["belief_target"],
-                    
-                    # Optimization / Trust
-                    "pso_sigma": _cfg.pso_update["sigma_pso"], # Using config default for hidden params
-                    "pso_drift": _cfg.pso_update["pso_drift_rate"],
-                    
-                    # Traits - Private
-                    "traits_private": {
-                        "risk_aversion_mean": DEFAULT_VALUES["priv_risk_value"],
-                        "risk_aversion_std": DEFAULT_VALUES["priv_risk_std"],
-                        "subjective_audit_prob_mean": st.session_state["priv_audit_mean"],
-                        "subjective_audit_prob_std": st.session_state["priv_audit_std"],
-                        "personal_norms_mean": st.session_state["priv_pn_mean"],
-                        "personal_norms_std": st.session_state["priv_pn_std"],
-                        "social_norms_mean": st.session_state["priv_sn_mean"],
-                        "social_norms_std": st.session_state["priv_sn_std"],
-                        "societal_norms_mean": st.session_state["priv_stn_mean"],
-                        "societal_norms_std": st.session_state["priv_stn_std"],
-                        "pso_mean": st.session_state["priv_pso_mean"],
-                        "pso_std": st.session_state["priv_pso_std"],
-                        "p_trust_mean": st.session_state["priv_pt_mean"],
-                        "p_trust_std": st.session_state["priv_pt_std"],
-                    },
-                    
-                    # Traits - Business
-                    "traits_business": {
-                        "risk_aversion_mean": DEFAULT_VALUES["biz_risk_value"],
-                        "risk_aversion_std": DEFAULT_VALUES["biz_risk_std"],
-                        "subjective_audit_prob_mean": st.session_state["biz_audit_mean"],
-                        "subjective_audit_prob_std": st.session_state["biz_audit_std"],
-                        "personal_norms_mean": st.session_state["biz_pn_mean"],
-                        "personal_norms_std": st.session_state["biz_pn_std"],
-                        "social_norms_mean": st.session_state["biz_sn_mean"],
-                        "social_norms_std": st.session_state["biz_sn_std"],
-                        "societal_norms_mean": st.session_state["biz_stn_mean"],
-                        "societal_norms_std": st.session_state["biz_stn_std"],
-                        "pso_mean": st.session_state["biz_pso_mean"],
-                        "pso_std": st.session_state["biz_pso_std"],
-                        "p_trust_mean": st.session_state["biz_pt_mean"],
-                        "p_trust_std": st.session_state["biz_pt_std"],
-                    },
-                    
-                    # SME Specifics
-                    "sme_risk": {
-                        "base": st.session_state["risk_base"],
-                        "delta_sector": st.session_state["delta_sector"],
-                        "delta_cash": st.session_state["delta_cash"],
-                        "delta_digi_high": st.session_state["delta_digi_high"],
-                        "delta_advisor": st.session_state["delta_advisor"],
-                        "delta_audit": st.session_state["delta_audit"],
-                    },
-                    "sme_opportunity": {
-                        "base": st.session_state["sme_opp_base_slider"],
-                        "min": st.session_state["sme_opp_min"], 
-                        "max": st.session_state["sme_opp_max"],
-                        "cash_bonus": st.session_state["sme_opp_cash"],
-                        "low_digi_bonus": st.session_state["sme_opp_digi_low"],
-                    },
-                    
-                    # Error Model
-                    "error_model": {
-                        "enabled": st.session_state["error_enabled"],
-                        "rate_private": st.session_state["error_rate_priv"] / 100.0,
-                        "rate_business": st.session_state["error_rate_biz"] / 100.0,
-                        "under_report_prob": st.session_state["error_under_prob"] / 100.0,
-                        "magnitude_min": st.session_state["error_mag_min"] / 100.0,
-                        "magnitude_max": st.session_state["error_mag_max"] / 100.0,
-                    }
-                }
-                
-                st.session_state.current_page = "running"
-                st.rerun()
+            # on_click runs before the next script run, so the app routes straight to the running page
+            st.button("Start Simulation", type="primary", use_container_width=True, key="btn_start",
+                      disabled=budget_exceeded, on_click=_start_simulation)
             
             # Show error message if budget exceeded (outside button block)
             if budget_exceeded:
-                st.markdown('<div style="color: #E53E3E; font-size: 12px; text-align: center; margin-top: 4px;">Budget exceeded. Reduce spending.</div>', unsafe_allow_html=True)
+                st.markdown(_BUDGET_EXCEEDED_HTML, unsafe_allow_html=True)
+
+
+# Flat simulation_params entries: (param_key, session_key, divisor for percentage widgets or None)
+_SIM_PARAM_KEYS = (
+    # Simulation core
+    ("n_agents", "pop_slider", None),
+    ("n_steps", "dur_slider", None),
+    ("n_runs", "run_slider", None),
+    ("business_ratio", "biz_ratio_slider", 100.0),
+    # Behaviors
+    ("tci_threshold_private", "tci_threshold_priv_slider", None),
+    ("tci_threshold_business", "tci_threshold_biz_slider", None),
+    # Enforcement
+    ("tax_rate", "tax_slider", 100.0),
+    ("penalty_rate", "penalty_slider", None),
+    ("audit_strategy", "sel_audit", None),
+    ("audit_rate_private", "priv_audit_slider", 100.0),
+    ("audit_rate_business", "biz_audit_slider", 100.0),
+    ("audit_depth_books", "audit_depth_slider", 100.0),
+    # Interventions
+    ("letter_enabled", "letter_enabled", None),
+    ("letter_rate_private", "letter_rate_priv_slider", 100.0),
+    ("letter_rate_business", "letter_rate_biz_slider", 100.0),
+    ("letter_strategy", "sel_letter_strategy", None),
+    ("letter_eff_perm", "letter_eff_perm", None),
+    ("letter_eff_temp", "letter_eff_temp", None),
+    ("letter_eff_trust", "letter_eff_trust", None),
+    ("phone_enabled", "phone_enabled", None),
+    ("phone_rate_private", "phone_rate_priv_slider", 100.0),
+    ("phone_rate_business", "phone_rate_biz_slider", 100.0),
+    ("phone_strategy", "sel_phone_strategy", None),
+    ("phone_sat_delta", "phone_sat_delta", None),
+    ("phone_dissat_delta", "phone_dissat_delta", None),
+    ("phone_eff_audit_temp", "phone_eff_audit_temp", None),
+    # Service
+    ("phone_sat", "phone_sat_slider", 100.0),
+    ("web_qual_private", "web_qual_priv_slider", None),
+    ("web_qual_business", "web_qual_biz_slider", None),
+    ("transparency", "transparency_toggle", None),
+    ("huba_delta", "huba_delta", None),
+    # Network & Social
+    ("homophily", "net_homo", None),
+    ("degree_mean", "net_deg", None),
+    ("social_influence", "soc_inf_slider", None),
+    # Belief Dynamics
+    ("belief_mu", "belief_mu", None),
+    ("belief_drift", "belief_drift", None),
+    ("belief_signal", "belief_signal", None),
+    ("belief_perception", "belief_perception", None),
+    ("belief_delta", "belief_delta", None),
+    ("belief_target", "belief_target", None),
+)
+
+
+def _flat_simulation_params() -> dict:
+    """Flat part of simulation_params, read once per key straight from session state."""
+    state = st.session_state
+    params = {}
+    for param_key, state_key, divisor in _SIM_PARAM_KEYS:
+        value = state[state_key]
+        params[param_key] = value / divisor if divisor else value
+    return params
+
+
+def _start_simulation():
+    """
+    on_click callback of Start Simulation: capture the settings and switch to
+    the running page without rendering this page once more.
+    """
+    # Capturing all parameter values from session state for simulation run
+    state = st.session_state
+    params = _flat_simulation_params()
+    params.update({
+        # Optimization / Trust
+        "pso_sigma": _cfg.pso_update["sigma_pso"], # Using config default for hidden params
+        "pso_drift": _cfg.pso_update["pso_drift_rate"],
+
+        # Traits
+        "traits_private": _traits_params("priv"),
+        "traits_business": _traits_params("biz"),
+
+        # SME Specifics
+        "sme_risk": _build_sme_risk(
+            state["risk_base"],
+            state["delta_sector"],
+            state["delta_cash"],
+            state["delta_digi_high"],
+            state["delta_advisor"],
+            state["delta_audit"],
+        ),
+        "sme_opportunity": _build_sme_opportunity(
+            state["sme_opp_base_slider"],
+            state["sme_opp_min"],
+            state["sme_opp_max"],
+            state["sme_opp_cash"],
+            state["sme_opp_digi_low"],
+        ),
+
+        # Error Model
+        "error_model": _build_error_model(
+            state["error_enabled"],
+            state["error_rate_priv"],
+            state["error_rate_biz"],
+            state["error_under_prob"],
+            state["error_mag_min"],
+            state["error_mag_max"],
+        ),
+    })
+    state["simulation_params"] = params
+
+    state["current_page"] = "running"
+
+
+# =====================================================
+# SIMULATION PARAMS SUB-DICTS
+# Cached on their inputs so unchanged sections are not rebuilt on every
+# Start click; the returned dicts are shared and must be treated as read-only.
+# =====================================================
+@lru_cache(maxsize=16, typed=True)
+def _build_traits(risk_mean, risk_std, audit_mean, audit_std, pn_mean, pn_std, sn_mean, sn_std,
+                  stn_mean, stn_std, pso_mean, pso_std, pt_mean, pt_std) -> dict:
+    return {
+        "risk_aversion_mean": risk_mean,
+        "risk_aversion_std": risk_std,
+        "subjective_audit_prob_mean": audit_mean,
+        "subjective_audit_prob_std": audit_std,
+        "personal_norms_mean": pn_mean,
+        "personal_norms_std": pn_std,
+        "social_norms_mean": sn_mean,
+        "social_norms_std": sn_std,
+        "societal_norms_mean": stn_mean,
+        "societal_norms_std": stn_std,
+        "pso_mean": pso_mean,
+        "pso_std": pso_std,
+        "p_trust_mean": pt_mean,
+        "p_trust_std": pt_std,
+    }
+
+
+def _traits_params(prefix: str) -> dict:
+    """Trait block for "priv" or "biz"; risk aversion is not exposed in the UI and keeps its default."""
+    return _build_traits(
+        DEFAULT_VALUES[f"{prefix}_risk_value"],
+        DEFAULT_VALUES[f"{prefix}_risk_std"],
+        *(st.session_state[f"{prefix}_{stem}_{stat}"]
+          for stem in ("audit", "pn", "sn", "stn", "pso", "pt")
+          for stat in ("mean", "std")),
+    )
+
+
+@lru_cache(maxsize=16, typed=True)
+def _build_sme_risk(base, delta_sector, delta_cash, delta_digi_high, delta_advisor, delta_audit) -> dict:
+    return {
+        "base": base,
+        "delta_sector": delta_sector,
+        "delta_cash": delta_cash,
+        "delta_digi_high": delta_digi_high,
+        "delta_advisor": delta_advisor,
+        "delta_audit": delta_audit,
+    }
+
+
+@lru_cache(maxsize=16, typed=True)
+def _build_sme_opportunity(base, min_, max_, cash_bonus, low_digi_bonus) -> dict:
+    return {
+        "base": base,
+        "min": min_,
+        "max": max_,
+        "cash_bonus": cash_bonus,
+        "low_digi_bonus": low_digi_bonus,
+    }
+
+
+@lru_cache(maxsize=16, typed=True)
+def _build_error_model(enabled, rate_priv, rate_biz, under_prob, mag_min, mag_max) -> dict:
+    """Error model block; the widgets hold percentages."""
+    return {
+        "enabled": enabled,
+        "rate_private": rate_priv / 100.0,
+        "rate_business": rate_biz / 100.0,
+        "under_report_prob": under_prob / 100.0,
+        "magnitude_min": mag_min / 100.0,
+        "magnitude_max": mag_max / 100.0,
+    }
+
+
+def _stage_state(batch: dict, key: str, value):
+    """
+    Stage a config value for `key` into `batch`, together with the matching
+    number-input value and a bumped slider version so the widgets resync.
+    """
+    batch[key] = value
+
+    # Sync the corresponding input box if it exists
+    input_key = f"{key}_input"
+    if input_key in st.session_state:
+        batch[input_key] = value
+
+    # Increment sync version to force slider refresh
+    sync_key = f"{key}_sync_v"
+    if sync_key in st.session_state:
+        batch[sync_key] = batch.get(sync_key, st.session_state[sync_key]) + 1
+
+
+def _compile_field_map(rows):
+    """Pre-split the dotted path (second element) of every table row into a key tuple."""
+    return tuple((row[0], tuple(row[1].split(".")), *row[2:]) for row in rows)
+
+
+# Widget keys filled from a config: (session_key, dotted_path, default, (lo, hi) or None, scale)
+_CONFIG_FIELD_MAP = _compile_field_map((
+    # Simulation setup
+    ("pop_slider", "simulation.n_agents", 1000, (500, 100000), 1),
+    ("dur_slider", "simulation.n_steps", 50, (10, 1000), 1),
+    # Letters
+    ("letter_enabled", "interventions.letter_deterrence.enabled", False, None, 1),
+    ("letter_rate_priv_slider", "interventions.letter_deterrence.rate.private", 0.02, (0.0, 10.0), 100),
+    ("letter_rate_biz_slider", "interventions.letter_deterrence.rate.business", 0.03, (0.0, 10.0), 100),
+    ("letter_eff_perm", "interventions.letter_deterrence.effects.subjective_audit_prob_permanent", 1.0, (0.0, 20.0), 1),
+    ("letter_eff_temp", "interventions.letter_deterrence.effects.subjective_audit_prob_temporary", 12.0, (0.0, 50.0), 1),
+    ("letter_eff_trust", "interventions.letter_deterrence.effects.trust_delta", -0.1, (-1.0, 1.0), 1),
+    # Phone
+    ("phone_enabled", "interventions.call.enabled", False, None, 1),
+    ("phone_rate_priv_slider", "interventions.call.rate.private", 0.01, (0.0, 10.0), 100),
+    ("phone_rate_biz_slider", "interventions.call.rate.business", 0.03, (0.0, 10.0), 100),
+    ("phone_sat_delta", "interventions.call.effects.satisfied.pso_delta", 0.3, (-1.0, 1.0), 1),
+    ("phone_dissat_delta", "interventions.call.effects.dissatisfied.pso_delta", -0.2, (-1.0, 1.0), 1),
+    ("phone_eff_audit_temp", "interventions.call.effects.satisfied.subjective_audit_prob_temporary", 8.0, (0.0, 50.0), 1),
+    # Service
+    ("phone_sat_slider", "pso_update.private.phone_satisfied_prob", 0.80, (50.0, 99.0), 100),
+    ("web_qual_priv_slider", "pso_update.private.webcare_mean", 3.2, (1.0, 5.0), 1),
+    ("web_qual_biz_slider", "pso_update.business.webcare_mean", 3.5, (1.0, 5.0), 1),
+    ("huba_delta", "pso_update.huba_delta", 1.0, (0.0, 5.0), 1),
+    # Fiscal environment
+    ("penalty_slider", "enforcement.penalty_rate", 3.0, (1.0, 5.0), 1),
+    ("biz_ratio_slider", "simulation.business_ratio", 0.179, (0, 100), 100),
+    # Belief & social
+    ("belief_mu", "belief_update.mu", 0.85, (0.0, 1.0), 1),
+    ("belief_drift", "belief_update.audit_prob_drift_rate", 0.1, (0.0, 1.0), 1),
+    ("belief_signal", "belief_update.audit_signal_strength", 0.3, (0.0, 100.0), 1),
+    ("belief_perception", "belief_update.perception_weight", 0.05, (0.0, 1.0), 1),
+    ("belief_delta", "belief_update.audit_prob_response_delta", 25.0, (0.0, 100.0), 1),
+    ("belief_target", "belief_update.audit_target_prob", 0.75, (0.0, 1.0), 1),
+    ("pso_sigma", "pso_update.sigma_pso", 0.68, None, 1),
+    ("pso_drift", "pso_update.pso_drift_rate", 0.25, None, 1),
+    ("trust_sigma", "trust_update.sigma_trust", 0.69, None, 1),
+    ("trust_punfair", "trust_update.p_unfair", 0.3, (0.0, 1.0), 1),
+    # Network & behaviour
+    ("soc_inf_slider", "social.social_influence", 0.5, (0.0, 1.0), 1),
+    ("net_homo", "network.homophily", 0.80, (0.0, 1.0), 1),
+    ("net_deg", "network.degree_mean", 86.27, (5.0, 300.0), 1),
+    ("degree_std_value", "network.degree_std", 64.99, None, 1),
+    # SME opportunity
+    ("sme_opp_base_slider", "sme.opportunity.base", 0.35, (0.0, 1.0), 1),
+    ("sme_opp_min", "sme.opportunity.min", 0.10, (0.0, 1.0), 1),
+    ("sme_opp_max", "sme.opportunity.max", 0.80, (0.0, 1.0), 1),
+    ("sme_opp_cash", "sme.opportunity.cash_bonus", 0.25, None, 1),
+    ("sme_opp_digi_low", "sme.opportunity.low_digi_bonus", 0.10, None, 1),
+    ("sme_opp_high_risk", "sme.opportunity.high_risk_sector_bonus", 0.0, None, 1),
+    ("sme_opp_micro", "sme.opportunity.micro_bonus", 0.0, None, 1),
+    # Risk modifiers
+    ("risk_base_value", "sme.base_risk_baseline", 0.2, None, 1),
+    ("delta_sector_value", "sme.delta_sector_high_risk", 0.2, None, 1),
+    ("delta_cash_value", "sme.delta_cash_intensive", 0.1, None, 1),
+    # Deep trait calibration
+    ("priv_risk_mean", "traits.private.risk_aversion.mean", 2.0, (0.5, 5.0), 1),
+    ("priv_risk_std", "traits.private.risk_aversion.std", 1.0, None, 1),
+    ("biz_risk_mean", "traits.business.risk_aversion.mean", 2.0, (0.5, 5.0), 1),
+    ("biz_risk_std", "traits.business.risk_aversion.std", 1.0, None, 1),
+    ("priv_pn_mean", "traits.private.personal_norms.mean", 3.40, (1.0, 5.0), 1),
+    ("priv_pn_std", "traits.private.personal_norms.std", 1.15, None, 1),
+    ("priv_sn_mean", "traits.private.social_norms.mean", 3.42, (1.0, 5.0), 1),
+    ("priv_sn_std", "traits.private.social_norms.std", 1.06, None, 1),
+    ("priv_stn_mean", "traits.private.societal_norms.mean", 3.97, (1.0, 5.0), 1),
+    ("priv_stn_std", "traits.private.societal_norms.std", 1.01, None, 1),
+    ("priv_pso_mean", "traits.private.pso.mean", 3.22, (1.0, 5.0), 1),
+    ("priv_pso_std", "traits.private.pso.std", 0.68, None, 1),
+    ("priv_pt_mean", "traits.private.p_trust.mean", 3.37, (1.0, 5.0), 1),
+    ("priv_pt_std", "traits.private.p_trust.std", 0.69, None, 1),
+    ("priv_audit_mean", "traits.private.subjective_audit_prob.mean", 10.0, (0.0, 100.0), 1),
+    ("priv_audit_std", "traits.private.subjective_audit_prob.std", 5.0, None, 1),  # TODO: confirm default
+    ("biz_pn_mean", "traits.business.personal_norms.mean", 3.82, (1.0, 5.0), 1),
+    ("biz_pn_std", "traits.business.personal_norms.std", 1.04, None, 1),
+    ("biz_sn_mean", "traits.business.social_norms.mean", 3.82, (1.0, 5.0), 1),
+    ("biz_sn_std", "traits.business.social_norms.std", 1.02, None, 1),
+    ("biz_stn_mean", "traits.business.societal_norms.mean", 4.12, (1.0, 5.0), 1),
+    ("biz_stn_std", "traits.business.societal_norms.std", 0.98, None, 1),
+    ("biz_pso_mean", "traits.business.pso.mean", 3.18, (1.0, 5.0), 1),
+    ("biz_pso_std", "traits.business.pso.std", 0.67, None, 1),
+    ("biz_pt_mean", "traits.business.p_trust.mean", 3.37, (1.0, 5.0), 1),
+    ("biz_pt_std", "traits.business.p_trust.std", 0.69, None, 1),
+    ("biz_audit_mean", "traits.business.subjective_audit_prob.mean", 22.0, (0.0, 100.0), 1),
+    ("biz_audit_std", "traits.business.subjective_audit_prob.std", 5.0, None, 1),
+))
+
+# Audit fields, relative to `interventions.audit` (preferred) or the legacy `enforcement` block
+_AUDIT_INTERV_FIELD_MAP = _compile_field_map((
+    ("priv_audit_slider", "rate.private", 0.01, (0.0, 10.0), 100),
+    ("biz_audit_slider", "rate.business", 0.01, (0.0, 10.0), 100),
+    ("audit_depth_slider", "audit_type_probs.books", 0.28, (0.0, 100.0), 100),
+))
+_AUDIT_ENF_FIELD_MAP = _compile_field_map((
+    ("priv_audit_slider", "audit_rate.private", 0.01, (0.0, 10.0), 100),
+    ("biz_audit_slider", "audit_rate.business", 0.01, (0.0, 10.0), 100),
+    ("audit_depth_slider", "audit_type_probs.books", 0.28, (0.0, 100.0), 100),
+))
+
+# Error model fields, relative to the `error_model` block (shown as percentages, unclamped)
+_ERROR_FIELD_MAP = _compile_field_map((
+    ("error_enabled", "enabled", False, None, 1),
+    ("error_rate_priv", "private.base", 0.005, None, 100),
+    ("error_rate_biz", "business.base", 0.35, None, 100),
+    ("error_mag_min", "magnitude.min", 0.12, None, 100),
+    ("error_mag_max", "magnitude.max", 0.23, None, 100),
+    ("error_under_prob", "under_report_prob", 0.90, None, 100),
+))
+
+# Penalties are negative in the config but entered as magnitudes in the UI
+_CONFIG_ABS_FIELD_MAP = _compile_field_map((
+    ("sme_opp_digi_high", "sme.opportunity.high_digi_penalty", 0.15),
+    ("delta_digi_high_value", "sme.delta_digi_high", -0.1),
+    ("delta_advisor_value", "sme.delta_advisor_yes", -0.1),
+    ("delta_audit_value", "sme.delta_audit_books", -0.1),
+))
+
+
+
+def _walk(d, path: tuple, default):
+    """Follow a key path through nested dicts, returning `default` if any step is missing."""
+    for part in path:
+        if not isinstance(d, dict) or part not in d:
+            return default
+        d = d[part]
+    return d
+
+
+def _clamp(val, min_val, max_val):
+    """Clamp a config value into a slider range."""
+    return max(min_val, min(max_val, val))
+
+
+_MISSING = object()
+
+
+def _lookup(layers, path: tuple, default):
+    """Read `path` from the first layer that defines it, as if the layers had been deep-merged."""
+    for layer in layers:
+        value = _walk(layer, path, _MISSING)
+        if value is not _MISSING:
+            return value
+    return default
+
+
+def _resolve_field(layers, row, prefix: tuple = ()):
+    """Widget value for one (key, path, default, bounds, scale) table row looked up in `layers`."""
+    _, path, default, bounds, scale = row
+    value = _lookup(layers, prefix + path, default)
+    if scale != 1:
+        value = value * scale
+    if bounds is not None:
+        value = _clamp(value, *bounds)
+    return value
+
+
+def _stage_fields(batch: dict, layers, field_map, prefix: tuple = ()):
+    """Stage every row of `field_map` looked up in `layers`."""
+    for row in field_map:
+        _stage_state(batch, row[0], _resolve_field(layers, row, prefix))
+
+
+@lru_cache(maxsize=1)
+def _default_field_values() -> dict:
+    """_CONFIG_FIELD_MAP resolved against the defaults alone; constant for the process."""
+    layers = (_load_default_config(),)
+    return {row[0]: _resolve_field(layers, row) for row in _CONFIG_FIELD_MAP}
+
 
 def _apply_config_to_state(config_data: dict):
     """
     Load a nested JSON config (as used by core/configs/*.json) into session state.
-    Merges with defaults first, then maps to widget keys with proper clamping.
+    Values missing from the config fall through to the defaults, then map to widget keys with proper clamping.
     """
     if not config_data:
         return
     
-    # Merge with defaults to fill in any missing values
-    from core.config import SimulationConfig, deep_merge
-    defaults = SimulationConfig.load_defaults()
-    merged = deep_merge(defaults.copy(), config_data)
-    
-    # Helper to clamp values within slider ranges
-    def clamp(val, min_val, max_val):
-        return max(min_val, min(max_val, val))
+    # Read-only lookups: the uploaded config shadows the defaults, no merged copy needed
+    layers = (config_data, _load_default_config())
     
-    # Helper to safely set state with type handling and slider sync
-    def set_state(key, value):
-        st.session_state[key] = value
-        
-        # Sync the corresponding input box if it exists
-        input_key = f"{key}_input"
-        if input_key in st.session_state:
-            st.session_state[input_key] = value
-            
-        # Increment sync version to force slider refresh
-        sync_key = f"{key}_sync_v"
-        if sync_key in st.session_state:
-            st.session_state[sync_key] += 1
+    # Stage every write and apply them in one session_state.update() at the end
+    batch = {}
     
-    # =====================================================
-    # SIMULATION SETUP
-    # =====================================================
-    sim = merged.get("simulation", {})
-    set_state("pop_slider", clamp(sim.get("n_agents", 1000), 500, 100000))
-    set_state("dur_slider", clamp(sim.get("n_steps", 50), 10, 1000))
-    # n_runs not in config files, keep default
-    
-    # =====================================================
-    # TAX AUTHORITY STRATEGY - ENFORCEMENT & INTERVENTIONS (AUDIT)
-    # =====================================================
-    enf = merged.get("enforcement", {})  # Ensure enf is defined for later use (tax/penalty)
-    
-    # FIX: Check 'interventions.audit' first, as per config_final.json
-    interv = merged.get("interventions", {})
-    audit_interv = interv.get("audit", {})
+    # Only walk the sections the upload provides; omitted ones resolve to the cached defaults
+    default_values = _default_field_values()
+    for row in _CONFIG_FIELD_MAP:
+        if row[1][0] in config_data:
+            _stage_state(batch, row[0], _resolve_field(layers, row))
+        else:
+            _stage_state(batch, row[0], default_values[row[0]])
     
-    if audit_interv and audit_interv.get("rate"):
-        # Use interventions schema
-        set_state("priv_audit_slider", clamp(audit_interv.get("rate", {}).get("private", 0.01) * 100, 0.0, 10.0))
-        set_state("biz_audit_slider", clamp(audit_interv.get("rate", {}).get("business", 0.01) * 100, 0.0, 10.0))
-        
-        strategy = audit_interv.get("selection_strategy", "random")
-        if strategy in ["random", "risk_based", "network"]:
-            set_state("sel_audit", strategy)
-            
-        books_prob = audit_interv.get("audit_type_probs", {}).get("books", 0.28) * 100
-        set_state("audit_depth_slider", clamp(books_prob, 0.0, 100.0))
+    # Audit: prefer 'interventions.audit' (as per config_final.json), else legacy enforcement block
+    if any(_walk(layer, ("interventions", "audit", "rate"), None) for layer in layers):
+        _stage_fields(batch, layers, _AUDIT_INTERV_FIELD_MAP, ("interventions", "audit"))
+        strategy = _lookup(layers, ("interventions", "audit", "selection_strategy"), "random")
     else:
-        # Fallback to legacy enforcement block
-        audit_rate = enf.get("audit_rate", {})
-        
-        # Private audit rate 
-        priv_audit = audit_rate.get("private", 0.01) * 100
-        set_state("priv_audit_slider", clamp(priv_audit, 0.0, 10.0))
-        
-        # Business audit rate
-        biz_audit = audit_rate.get("business", 0.01) * 100
-        set_state("biz_audit_slider", clamp(biz_audit, 0.0, 10.0))
-        
-        # Audit depth
-        audit_type_probs = enf.get("audit_type_probs", {})
-        books_prob = audit_type_probs.get("books", 0.28) * 100
-        set_state("audit_depth_slider", clamp(books_prob, 0.0, 100.0))
-        
-        # Audit strategy
-        strategy = enf.get("audit_strategy", "random")
-        if strategy in ["random", "risk_based", "network"]:
-            set_state("sel_audit", strategy)
-    
-    # =====================================================
-    # TAX AUTHORITY STRATEGY - INTERVENTIONS
-    # =====================================================
-    interv = merged.get("interventions", {})
-    
-    # Letters
-    letters = interv.get("letter_deterrence", {})
-    set_state("letter_enabled", letters.get("enabled", False))
-    set_state("letter_rate_priv_slider", clamp(letters.get("rate", {}).get("private", 0.02) * 100, 0.0, 10.0))
-    set_state("letter_rate_biz_slider", clamp(letters.get("rate", {}).get("business", 0.03) * 100, 0.0, 10.0))
-    if letters.get("selection_strategy") in ["random", "risk_based", "network"]:
-        set_state("sel_letter_strategy", letters.get("selection_strategy"))
-        
-    letter_eff = letters.get("effects", {})
-    set_state("letter_eff_perm", clamp(letter_eff.get("subjective_audit_prob_permanent", 1.0), 0.0, 20.0))
-    set_state("letter_eff_temp", clamp(letter_eff.get("subjective_audit_prob_temporary", 12.0), 0.0, 50.0))
-    set_state("letter_eff_trust", clamp(letter_eff.get("trust_delta", -0.1), -1.0, 1.0))
-
-    # Phone
-    phone = interv.get("call", {})
-    set_state("phone_enabled", phone.get("enabled", False))
-    set_state("phone_rate_priv_slider", clamp(phone.get("rate", {}).get("private", 0.01) * 100, 0.0, 10.0))
-    set_state("phone_rate_biz_slider", clamp(phone.get("rate", {}).get("business", 0.03) * 100, 0.0, 10.0))
-    if phone.get("selection_strategy") in ["random", "risk_based", "network"]:
-        set_state("sel_phone_strategy", phone.get("selection_strategy"))
-        
-    phone_eff = phone.get("effects", {})
-    set_state("phone_sat_delta", clamp(phone_eff.get("satisfied", {}).get("pso_delta", 0.3), -1.0, 1.0))
-    set_state("phone_dissat_delta", clamp(phone_eff.get("dissatisfied", {}).get("pso_delta", -0.2), -1.0, 1.0))
-    set_state("phone_eff_audit_temp", clamp(phone_eff.get("satisfied", {}).get("subjective_audit_prob_temporary", 8.0), 0.0, 50.0))
-
-    # =====================================================
-    # TAX AUTHORITY STRATEGY - SERVICE
-    # =====================================================
-    pso_update = merged.get("pso_update", {})
-    priv_pso = pso_update.get("private", {})
-    
-    # Phone satisfaction
-    phone_sat = priv_pso.get("phone_satisfied_prob", 0.80) * 100
-    set_state("phone_sat_slider", clamp(phone_sat, 50.0, 99.0))
+        _stage_fields(batch, layers, _AUDIT_ENF_FIELD_MAP, ("enforcement",))
+        strategy = _lookup(layers, ("enforcement", "audit_strategy"), "random")
+    if strategy in _WIDGET_STRATEGIES:
+        _stage_state(batch, "sel_audit", _WIDGET_STRATEGIES[strategy])
     
-    # Web quality
-    web_qual_priv = priv_pso.get("webcare_mean", 3.2)
-    set_state("web_qual_priv_slider", clamp(web_qual_priv, 1.0, 5.0))
+    # Intervention strategies are only taken over when recognised
+    for key, path in (("sel_letter_strategy", ("interventions", "letter_deterrence", "selection_strategy")),
+                      ("sel_phone_strategy", ("interventions", "call", "selection_strategy"))):
+        strategy = _lookup(layers, path, None)
+        if strategy in _WIDGET_STRATEGIES:
+            _stage_state(batch, key, _WIDGET_STRATEGIES[strategy])
     
-    biz_pso = pso_update.get("business", {})
-    web_qual_biz = biz_pso.get("webcare_mean", 3.5)
-    set_state("web_qual_biz_slider", clamp(web_qual_biz, 1.0, 5.0))
-    
-    # Transparency (HUBA)
-    set_state("huba_delta", clamp(pso_update.get("huba_delta", 1.0), 0.0, 5.0))
+    for key, path, default in _CONFIG_ABS_FIELD_MAP:
+        _stage_state(batch, key, abs(_lookup(layers, path, default)))
     
     # Transparency toggle logic
-    trust_upd = merged.get("trust_update", {})
-    p_unfair = trust_upd.get("p_unfair", 0.30)
-    set_state("transparency_toggle", p_unfair < 0.2)
-    
-    # =====================================================
-    # FISCAL ENVIRONMENT
-    # =====================================================
-    tax_rate = int(enf.get("tax_rate", 0.30) * 100)
-    set_state("tax_slider", clamp(tax_rate, 10, 60))
-    
-    penalty = enf.get("penalty_rate", 3.0)
-    set_state("penalty_slider", clamp(penalty, 1.0, 5.0))
-    
-    biz_ratio = sim.get("business_ratio", 0.179) * 100
-    set_state("biz_ratio_slider", clamp(biz_ratio, 0, 100))
-    
-    # =====================================================
-    # EXPERT: BELIEF & SOCIAL
-    # =====================================================
-    belief_upd = merged.get("belief_update", {})
-    set_state("belief_mu", clamp(belief_upd.get("mu", 0.85), 0.0, 1.0))
-    set_state("belief_drift", clamp(belief_upd.get("audit_prob_drift_rate", 0.1), 0.0, 1.0))
-    set_state("belief_signal", clamp(belief_upd.get("audit_signal_strength", 0.3), 0.0, 100.0))
-    # NEW: Missing belief params
-    # Note: These keys might need new widgets in render() if they don't exist yet
-    # For now, we ensure they are loaded if widgets exist
-    set_state("belief_perception", clamp(belief_upd.get("perception_weight", 0.05), 0.0, 1.0))
-    set_state("belief_delta", clamp(belief_upd.get("audit_prob_response_delta", 25.0), 0.0, 100.0))
-    set_state("belief_target", clamp(belief_upd.get("audit_target_prob", 0.75), 0.0, 1.0))
-    
-    set_state("pso_sigma", pso_update.get("sigma_pso", 0.68))
-    set_state("pso_drift", pso_update.get("pso_drift_rate", 0.25))
-    set_state("trust_sigma", trust_upd.get("sigma_trust", 0.69))
-    set_state("trust_punfair", clamp(trust_upd.get("p_unfair", 0.3), 0.0, 1.0))
-
-    # =====================================================
-    # EXPERT: NETWORK & BEHAVIOR
-    # =====================================================
-    social = merged.get("social", {})
-    set_state("soc_inf_slider", clamp(social.get("social_influence", 0.5), 0.0, 1.0))
-    
-    network = merged.get("network", {})
-    set_state("net_homo", clamp(network.get("homophily", 0.80), 0.0, 1.0))
-    set_state("net_deg", clamp(network.get("degree_mean", 86.27), 5.0, 300.0))
-    set_state("degree_std_value", network.get("degree_std", 64.99))
-    
-    # =====================================================
-    # EXPERT: SME OPPORTUNITY
-    # =====================================================
-    sme = merged.get("sme", {}) # Access via 'sme' key not 'agents_config'
-    opp = sme.get("opportunity", {})
-    set_state("sme_opp_base_slider", clamp(opp.get("base", 0.35), 0.0, 1.0))
-    set_state("sme_opp_min", clamp(opp.get("min", 0.10), 0.0, 1.0))
-    set_state("sme_opp_max", clamp(opp.get("max", 0.80), 0.0, 1.0))
-    set_state("sme_opp_cash", opp.get("cash_bonus", 0.25))
-    set_state("sme_opp_digi_low", opp.get("low_digi_bonus", 0.10))
-    set_state("sme_opp_digi_high", abs(opp.get("high_digi_penalty", 0.15)))
-    set_state("sme_opp_high_risk", opp.get("high_risk_sector_bonus", 0.0))
-    set_state("sme_opp_micro", opp.get("micro_bonus", 0.0))
+    _stage_state(batch, "transparency_toggle", _lookup(layers, ("trust_update", "p_unfair"), 0.30) < 0.2)
     
-    # Risk Modifiers
-    set_state("risk_base_value", sme.get("base_risk_baseline", 0.2))
-    set_state("delta_sector_value", sme.get("delta_sector_high_risk", 0.2))
-    set_state("delta_cash_value", sme.get("delta_cash_intensive", 0.1))
-    set_state("delta_digi_high_value", abs(sme.get("delta_digi_high", -0.1)))
-    set_state("delta_advisor_value", abs(sme.get("delta_advisor_yes", -0.1)))
-    set_state("delta_audit_value", abs(sme.get("delta_audit_books", -0.1)))
+    # Integer percentage sliders
+    _stage_state(batch, "tax_slider", _clamp(int(_lookup(layers, ("enforcement", "tax_rate"), 0.30) * 100), 10, 60))
+    _stage_state(batch, "compliance_slider", _clamp(int(_lookup(layers, ("behaviors", "distribution", "honest"), 0.80) * 100), 0, 100))
     
-    # =====================================================
-    # EXPERT: ERROR MODEL
-    # =====================================================
     # FIX: Check ROOT first, then simulation block
-    err = merged.get("error_model", sim.get("error_model", {}))
-    
-    set_state("error_enabled", err.get("enabled", False))
-    set_state("error_rate_priv", err.get("private", {}).get("base", 0.005) * 100)
-    set_state("error_rate_biz", err.get("business", {}).get("base", 0.35) * 100)
-    set_state("error_mag_min", err.get("magnitude", {}).get("min", 0.12) * 100)
-    set_state("error_mag_max", err.get("magnitude", {}).get("max", 0.23) * 100)
-    set_state("error_under_prob", err.get("under_report_prob", 0.90) * 100)
+    err_prefix = ("error_model",) if any("error_model" in layer for layer in layers) else ("simulation", "error_model")
+    _stage_fields(batch, layers, _ERROR_FIELD_MAP, err_prefix)
 
-    # =====================================================
-    # DEEP TRAIT CALIBRATION
-    # =====================================================
-    traits = merged.get("traits", {})
-    priv_traits = traits.get("private", {})
-    biz_traits = traits.get("business", {})
-    
-    # Risk Aversion
-    risk_av = priv_traits.get("risk_aversion", {})
-    set_state("priv_risk_mean", clamp(risk_av.get("mean", 2.0), 0.5, 5.0))
-    set_state("priv_risk_std", risk_av.get("std", 1.0))
-    
-    risk_av_biz = biz_traits.get("risk_aversion", {})
-    set_state("biz_risk_mean", clamp(risk_av_biz.get("mean", 2.0), 0.5, 5.0))
-    set_state("biz_risk_std", risk_av_biz.get("std", 1.0))
-    
-    # Behaviors (Honest Ratio -> Compliance Slider legacy)
-    behaviors = merged.get("behaviors", {})
-    dist = behaviors.get("distribution", {})
-    honest = int(dist.get("honest", 0.80) * 100)
-    set_state("compliance_slider", clamp(honest, 0, 100))
-    
-    # Private Traits
-    priv_pn = priv_traits.get("personal_norms", {})
-    set_state("priv_pn_mean", clamp(priv_pn.get("mean", 3.40), 1.0, 5.0))
-    set_state("priv_pn_std", priv_pn.get("std", 1.15))
-    
-    priv_sn = priv_traits.get("social_norms", {})
-    set_state("priv_sn_mean", clamp(priv_sn.get("mean", 3.42), 1.0, 5.0))
-    set_state("priv_sn_std", priv_sn.get("std", 1.06))
-    
-    priv_stn = priv_traits.get("societal_norms", {})
-    set_state("priv_stn_mean", clamp(priv_stn.get("mean", 3.97), 1.0, 5.0))
-    set_state("priv_stn_std", priv_stn.get("std", 1.01))
-    
-    priv_pso = priv_traits.get("pso", {})
-    set_state("priv_pso_mean", clamp(priv_pso.get("mean", 3.22), 1.0, 5.0))
-    set_state("priv_pso_std", priv_pso.get("std", 0.68))
-    
-    priv_pt = priv_traits.get("p_trust", {})
-    set_state("priv_pt_mean", clamp(priv_pt.get("mean", 3.37), 1.0, 5.0))
-    set_state("priv_pt_std", priv_pt.get("std", 0.69))
-    
-    priv_audit = priv_traits.get("subjective_audit_prob", {})
-    set_state("priv_audit_mean", clamp(priv_audit.get("mean", 10.0), 0.0, 100.0))
-    set_state("priv_audit_std", priv_audit.get("std", 5.0)) # TODO: confirm default
-    
-    # Business Traits
-    biz_pn = biz_traits.get("personal_norms", {})
-    set_state("biz_pn_mean", clamp(biz_pn.get("mean", 3.82), 1.0, 5.0))
-    set_state("biz_pn_std", biz_pn.get("std", 1.04))
-    
-    biz_sn = biz_traits.get("social_norms", {})
-    set_state("biz_sn_mean", clamp(biz_sn.get("mean", 3.82), 1.0, 5.0))
-    set_state("biz_sn_std", biz_sn.get("std", 1.02))
-    
-    biz_stn = biz_traits.get("societal_norms", {})
-    set_state("biz_stn_mean", clamp(biz_stn.get("mean", 4.12), 1.0, 5.0))
-    set_state("biz_stn_std", biz_stn.get("std", 0.98))
-    
-    biz_pso = biz_traits.get("pso", {})
-    set_state("biz_pso_mean", clamp(biz_pso.get("mean", 3.18), 1.0, 5.0))
-    set_state("biz_pso_std", biz_pso.get("std", 0.67))
-    
-    biz_pt = biz_traits.get("p_trust", {})
-    set_state("biz_pt_mean", clamp(biz_pt.get("mean", 3.37), 1.0, 5.0))
-    set_state("biz_pt_std", biz_pt.get("std", 0.69))
-    
-    biz_audit = biz_traits.get("subjective_audit_prob", {})
-    set_state("biz_audit_mean", clamp(biz_audit.get("mean", 22.0), 0.0, 100.0))
-    set_state("biz_audit_std", biz_audit.get("std", 5.0))
+    st.session_state.update(batch)
 
-def load_params_into_state(params: dict):
+
+def _on_config_upload():
     """
-    Legacy function for loading flat simulation_params dict into state.
-    Kept for backward compatibility.
+    on_change callback of the config uploader. Callbacks run before the script,
+    so the config lands in session state ahead of the widgets without a rerun.
     """
-    if not params:
+    st.session_state["_config_load_error"] = None
+    uploaded_config = st.session_state.get("config_uploader")
+    if uploaded_config is None:
         return
 
-    def clamp(val, min_val, max_val):
-        return max(min_val, min(max_val, val))
+    # Identify the upload by content so edited files with the same name/size still load
+    raw = uploaded_config.getvalue()
+    file_id = _config_digest(raw)
+    # Only process if this is a NEW file (not already processed)
+    if st.session_state.get("_last_loaded_config_id") == file_id:
+        return
+
+    try:
+        _apply_config_to_state(_parse_config(file_id, raw))
+    except orjson.JSONDecodeError as e:
+        st.session_state["_config_load_error"] = f"Invalid JSON file: {e}"
+        return
+    except Exception as e:
+        st.session_state["_config_load_error"] = f"Error loading config: {e}"
+        return
+
+    # Mark this file as processed
+    st.session_state["_last_loaded_config_id"] = file_id
+    st.toast(f"Loaded: {uploaded_config.name}")
 
-    # Helper to safely set state with type handling and slider sync
-    def set_state(key, value):
-        st.session_state[key] = value
-        
-        # Sync the corresponding input box if it exists
-        input_key = f"{key}_input"
-        if input_key in st.session_state:
-            st.session_state[input_key] = value
-            
-        # Increment sync version to force slider refresh
-        sync_key = f"{key}_sync_v"
-        if sync_key in st.session_state:
-            st.session_state[sync_key] += 1
 
+# Widget keys filled from a flat simulation_params dict: (session_key, dotted_path, default, (lo, hi) or None, scale)
+_PARAMS_FIELD_MAP = _compile_field_map((
     # Simulation
-    set_state("pop_slider", clamp(params.get("n_agents", 1000), 500, 100000))
-    set_state("dur_slider", clamp(params.get("n_steps", 50), 10, 1000))
-    set_state("run_slider", clamp(params.get("n_runs", 1), 1, 10))
-    
+    ("pop_slider", "n_agents", 1000, (500, 100000), 1),
+    ("dur_slider", "n_steps", 50, (10, 1000), 1),
+    ("run_slider", "n_runs", 1, (1, 10), 1),
     # Enforcement
-    set_state("tax_slider", clamp(int(params.get("tax_rate", 0.3) * 100), 10, 60))
-    set_state("penalty_slider", clamp(params.get("penalty_rate", 3.0), 1.0, 5.0))
-    set_state("compliance_slider", clamp(int(params.get("honest_ratio", 0.80) * 100), 0, 100))
-    
-    strategy = params.get("audit_strategy", "random")
-    if strategy in ["random", "risk_based", "network"]:
-        set_state("sel_audit", strategy)
-    
-    set_state("priv_audit_slider", clamp(params.get("audit_rate_private", 0.01) * 100, 0.0, 10.0))
-    set_state("biz_audit_slider", clamp(params.get("audit_rate_business", 0.01) * 100, 0.0, 10.0))
-    
-    # biz_ratio uses standard sync mechanism
-    set_state("biz_ratio_slider", clamp(params.get("business_ratio", 0.179) * 100, 0.0, 100.0))
-    
+    ("penalty_slider", "penalty_rate", 3.0, (1.0, 5.0), 1),
+    ("priv_audit_slider", "audit_rate_private", 0.01, (0.0, 10.0), 100),
+    ("biz_audit_slider", "audit_rate_business", 0.01, (0.0, 10.0), 100),
+    ("biz_ratio_slider", "business_ratio", 0.179, (0.0, 100.0), 100),
     # Interventions
-    set_state("letter_enabled", params.get("letter_enabled", False))
-    set_state("letter_rate_priv_slider", clamp(params.get("letter_rate_private", 0.02) * 100, 0.0, 10.0))
-    set_state("letter_rate_biz_slider", clamp(params.get("letter_rate_business", 0.03) * 100, 0.0, 10.0))
-    set_state("sel_letter_strategy", params.get("letter_strategy", "random"))
-    set_state("letter_eff_perm", clamp(params.get("letter_eff_perm", 1.0), 0.0, 20.0))
-    set_state("letter_eff_temp", clamp(params.get("letter_eff_temp", 12.0), 0.0, 50.0))
-    set_state("letter_eff_trust", clamp(params.get("letter_eff_trust", -0.1), -1.0, 1.0))
-
-    set_state("phone_enabled", params.get("phone_enabled", False))
-    set_state("phone_rate_priv_slider", clamp(params.get("phone_rate_private", 0.01) * 100, 0.0, 10.0))
-    set_state("phone_rate_biz_slider", clamp(params.get("phone_rate_business", 0.03) * 100, 0.0, 10.0))
-    set_state("sel_phone_strategy", params.get("phone_strategy", "random"))
-    set_state("phone_sat_delta", clamp(params.get("phone_sat_delta", 0.3), -1.0, 1.0))
-    set_state("phone_dissat_delta", clamp(params.get("phone_dissat_delta", -0.2), -1.0, 1.0))
-    set_state("phone_eff_audit_temp", clamp(params.get("phone_eff_audit_temp", 8.0), 0.0, 50.0))
-
+    ("letter_enabled", "letter_enabled", False, None, 1),
+    ("letter_rate_priv_slider", "letter_rate_private", 0.02, (0.0, 10.0), 100),
+    ("letter_rate_biz_slider", "letter_rate_business", 0.03, (0.0, 10.0), 100),
+    ("letter_eff_perm", "letter_eff_perm", 1.0, (0.0, 20.0), 1),
+    ("letter_eff_temp", "letter_eff_temp", 12.0, (0.0, 50.0), 1),
+    ("letter_eff_trust", "letter_eff_trust", -0.1, (-1.0, 1.0), 1),
+    ("phone_enabled", "phone_enabled", False, None, 1),
+    ("phone_rate_priv_slider", "phone_rate_private", 0.01, (0.0, 10.0), 100),
+    ("phone_rate_biz_slider", "phone_rate_business", 0.03, (0.0, 10.0), 100),
+    ("phone_sat_delta", "phone_sat_delta", 0.3, (-1.0, 1.0), 1),
+    ("phone_dissat_delta", "phone_dissat_delta", -0.2, (-1.0, 1.0), 1),
+    ("phone_eff_audit_temp", "phone_eff_audit_temp", 8.0, (0.0, 50.0), 1),
     # Service
-    set_state("phone_sat_slider", clamp(params.get("phone_sat", 0.8) * 100, 50.0, 99.0))
-    set_state("web_qual_priv_slider", clamp(params.get("web_qual_private", 3.2), 1.0, 5.0))
-    set_state("web_qual_biz_slider", clamp(params.get("web_qual_business", 3.5), 1.0, 5.0))
-    set_state("transparency_toggle", params.get("transparency", False))
-    set_state("huba_delta", clamp(params.get("huba_delta", 1.0), 0.0, 5.0))
-
+    ("phone_sat_slider", "phone_sat", 0.8, (50.0, 99.0), 100),
+    ("web_qual_priv_slider", "web_qual_private", 3.2, (1.0, 5.0), 1),
+    ("web_qual_biz_slider", "web_qual_business", 3.5, (1.0, 5.0), 1),
+    ("transparency_toggle", "transparency", False, None, 1),
+    ("huba_delta", "huba_delta", 1.0, (0.0, 5.0), 1),
     # Network/Social
-    set_state("net_homo", clamp(params.get("homophily", 0.80), 0.0, 1.0))
-    set_state("net_deg", clamp(params.get("degree_mean", 86.27), 5.0, 300.0))
-    set_state("soc_inf_slider", clamp(params.get("social_influence", 0.5), 0.0, 1.0))
-    
+    ("net_homo", "homophily", 0.80, (0.0, 1.0), 1),
+    ("net_deg", "degree_mean", 86.27, (5.0, 300.0), 1),
+    ("soc_inf_slider", "social_influence", 0.5, (0.0, 1.0), 1),
     # Belief Dynamics
-    set_state("belief_mu", clamp(params.get("belief_mu", 0.85), 0.0, 1.0))
-    set_state("belief_drift", clamp(params.get("belief_drift", 0.1), 0.0, 1.0))
-    set_state("belief_signal", clamp(params.get("belief_signal", 0.3), 0.0, 100.0))
-    set_state("belief_perception", clamp(params.get("belief_perception", 0.05), 0.0, 1.0))
-    set_state("belief_delta", clamp(params.get("belief_delta", 25.0), 0.0, 100.0))
-    set_state("belief_target", clamp(params.get("belief_target", 0.75), 0.0, 1.0))
-
+    ("belief_mu", "belief_mu", 0.85, (0.0, 1.0), 1),
+    ("belief_drift", "belief_drift", 0.1, (0.0, 1.0), 1),
+    ("belief_signal", "belief_signal", 0.3, (0.0, 100.0), 1),
+    ("belief_perception", "belief_perception", 0.05, (0.0, 1.0), 1),
+    ("belief_delta", "belief_delta", 25.0, (0.0, 100.0), 1),
+    ("belief_target", "belief_target", 0.75, (0.0, 1.0), 1),
     # SME Specifics
-    sme_risk = params.get("sme_risk", {})
-    set_state("risk_base", clamp(sme_risk.get("base", 0.2), 0.0, 1.0))
-    set_state("delta_sector", clamp(sme_risk.get("delta_sector", 0.2), 0.0, 0.5))
-    set_state("delta_cash", clamp(sme_risk.get("delta_cash", 0.1), 0.0, 0.5))
-    set_state("delta_digi_high", clamp(sme_risk.get("delta_digi_high", -0.1), -0.5, 0.0))
-    set_state("delta_advisor", clamp(sme_risk.get("delta_advisor", -0.1), -0.5, 0.0))
-    set_state("delta_audit", clamp(sme_risk.get("delta_audit", -0.1), -0.5, 0.0))
-
-    sme_opp = params.get("sme_opportunity", {})
-    set_state("sme_opp_base_slider", clamp(sme_opp.get("base", 0.35), 0.0, 1.0))
-    set_state("sme_opp_min", clamp(sme_opp.get("min", 0.10), 0.0, 1.0))
-    set_state("sme_opp_max", clamp(sme_opp.get("max", 0.80), 0.0, 1.0))
-    set_state("sme_opp_cash", clamp(sme_opp.get("cash_bonus", 0.25), 0.0, 1.0))
-    set_state("sme_opp_digi_low", clamp(sme_opp.get("low_digi_bonus", 0.10), 0.0, 1.0))
-
+    ("risk_base", "sme_risk.base", 0.2, (0.0, 1.0), 1),
+    ("delta_sector", "sme_risk.delta_sector", 0.2, (0.0, 0.5), 1),
+    ("delta_cash", "sme_risk.delta_cash", 0.1, (0.0, 0.5), 1),
+    ("delta_digi_high", "sme_risk.delta_digi_high", -0.1, (-0.5, 0.0), 1),
+    ("delta_advisor", "sme_risk.delta_advisor", -0.1, (-0.5, 0.0), 1),
+    ("delta_audit", "sme_risk.delta_audit", -0.1, (-0.5, 0.0), 1),
+    ("sme_opp_base_slider", "sme_opportunity.base", 0.35, (0.0, 1.0), 1),
+    ("sme_opp_min", "sme_opportunity.min", 0.10, (0.0, 1.0), 1),
+    ("sme_opp_max", "sme_opportunity.max", 0.80, (0.0, 1.0), 1),
+    ("sme_opp_cash", "sme_opportunity.cash_bonus", 0.25, (0.0, 1.0), 1),
+    ("sme_opp_digi_low", "sme_opportunity.low_digi_bonus", 0.10, (0.0, 1.0), 1),
     # Error Model
-    err = params.get("error_model", {})
-    set_state("error_enabled", err.get("enabled", False))
-    set_state("error_rate_priv", clamp(err.get("rate_private", 0.005) * 100, 0.0, 10.0))
-    set_state("error_rate_biz", clamp(err.get("rate_business", 0.35) * 100, 0.0, 50.0))
-    set_state("error_mag_min", clamp(err.get("magnitude_min", 0.12) * 100, 0.1, 100.0))
-    set_state("error_mag_max", clamp(err.get("magnitude_max", 0.23) * 100, 0.1, 100.0))
-    set_state("error_under_prob", clamp(err.get("under_report_prob", 0.90) * 100, 0.0, 100.0))
-
-    # Traits - Private
+    ("error_enabled", "error_model.enabled", False, None, 1),
+    ("error_rate_priv", "error_model.rate_private", 0.005, (0.0, 10.0), 100),
+    ("error_rate_biz", "error_model.rate_business", 0.35, (0.0, 50.0), 100),
+    ("error_mag_min", "error_model.magnitude_min", 0.12, (0.1, 100.0), 100),
+    ("error_mag_max", "error_model.magnitude_max", 0.23, (0.1, 100.0), 100),
+    ("error_under_prob", "error_model.under_report_prob", 0.90, (0.0, 100.0), 100),
+))
+
+# Trait blocks are only applied when present in the params
+_PARAMS_TRAITS_PRIV_FIELD_MAP = _compile_field_map((
+    ("priv_audit_mean", "subjective_audit_prob_mean", 10.0, (0.0, 100.0), 1),
+    ("priv_audit_std", "subjective_audit_prob_std", 5.0, (0.0, 50.0), 1),
+    ("priv_pn_mean", "personal_norms_mean", 3.4, (1.0, 5.0), 1),
+    ("priv_pn_std", "personal_norms_std", 1.15, (0.0, 2.0), 1),
+    ("priv_sn_mean", "social_norms_mean", 3.42, (1.0, 5.0), 1),
+    ("priv_sn_std", "social_norms_std", 1.06, (0.0, 2.0), 1),
+    ("priv_stn_mean", "societal_norms_mean", 3.97, (1.0, 5.0), 1),
+    ("priv_stn_std", "societal_norms_std", 1.01, (0.0, 2.0), 1),
+    ("priv_pso_mean", "pso_mean", 3.22, (1.0, 5.0), 1),
+    ("priv_pso_std", "pso_std", 0.68, (0.0, 2.0), 1),
+    ("priv_pt_mean", "p_trust_mean", 3.37, (1.0, 5.0), 1),
+    ("priv_pt_std", "p_trust_std", 0.69, (0.0, 2.0), 1),
+))
+_PARAMS_TRAITS_BIZ_FIELD_MAP = _compile_field_map((
+    ("biz_audit_mean", "subjective_audit_prob_mean", 22.0, (0.0, 100.0), 1),
+    ("biz_audit_std", "subjective_audit_prob_std", 5.0, (0.0, 50.0), 1),
+    ("biz_pn_mean", "personal_norms_mean", 3.82, (1.0, 5.0), 1),
+    ("biz_pn_std", "personal_norms_std", 1.04, (0.0, 2.0), 1),
+    ("biz_sn_mean", "social_norms_mean", 3.82, (1.0, 5.0), 1),
+    ("biz_sn_std", "social_norms_std", 1.02, (0.0, 2.0), 1),
+    ("biz_stn_mean", "societal_norms_mean", 4.12, (1.0, 5.0), 1),
+    ("biz_stn_std", "societal_norms_std", 0.98, (0.0, 2.0), 1),
+    ("biz_pso_mean", "pso_mean", 3.18, (1.0, 5.0), 1),
+    ("biz_pso_std", "pso_std", 0.67, (0.0, 2.0), 1),
+    ("biz_pt_mean", "p_trust_mean", 3.37, (1.0, 5.0), 1),
+    ("biz_pt_std", "p_trust_std", 0.69, (0.0, 2.0), 1),
+))
+
+
+def load_params_into_state(params: dict):
+    """
+    Legacy function for loading flat simulation_params dict into state.
+    Kept for backward compatibility.
+    """
+    if not params:
+        return
+
+    # Stage every write and apply them in one session_state.update() at the end
+    batch = {}
+    _stage_fields(batch, (params,), _PARAMS_FIELD_MAP)
+
+    # Integer percentage sliders
+    _stage_state(batch, "tax_slider", _clamp(int(params.get("tax_rate", 0.3) * 100), 10, 60))
+    _stage_state(batch, "compliance_slider", _clamp(int(params.get("honest_ratio", 0.80) * 100), 0, 100))
+
+    # Strategies are mapped onto the selectbox options ("risk_based" -> "risk"); unknown names are skipped
+    for key, param in (("sel_audit", "audit_strategy"),
+                       ("sel_letter_strategy", "letter_strategy"),
+                       ("sel_phone_strategy", "phone_strategy")):
+        strategy = params.get(param, "random")
+        if strategy in _WIDGET_STRATEGIES:
+            _stage_state(batch, key, _WIDGET_STRATEGIES[strategy])
+
+    # Traits
     tr_priv = params.get("traits_private", {})
     if tr_priv:
-        set_state("priv_audit_mean", clamp(tr_priv.get("subjective_audit_prob_mean", 10.0), 0.0, 100.0))
-        set_state("priv_audit_std", clamp(tr_priv.get("subjective_audit_prob_std", 5.0), 0.0, 50.0))
-        set_state("priv_pn_mean", clamp(tr_priv.get("personal_norms_mean", 3.4), 1.0, 5.0))
-        set_state("priv_pn_std", clamp(tr_priv.get("personal_norms_std", 1.15), 0.0, 2.0))
-        set_state("priv_sn_mean", clamp(tr_priv.get("social_norms_mean", 3.42), 1.0, 5.0))
-        set_state("priv_sn_std", clamp(tr_priv.get("social_norms_std", 1.06), 0.0, 2.0))
-        set_state("priv_stn_mean", clamp(tr_priv.get("societal_norms_mean", 3.97), 1.0, 5.0))
-        set_state("priv_stn_std", clamp(tr_priv.get("societal_norms_std", 1.01), 0.0, 2.0))
-        set_state("priv_pso_mean", clamp(tr_priv.get("pso_mean", 3.22), 1.0, 5.0))
-        set_state("priv_pso_std", clamp(tr_priv.get("pso_std", 0.68), 0.0, 2.0))
-        set_state("priv_pt_mean", clamp(tr_priv.get("p_trust_mean", 3.37), 1.0, 5.0))
-        set_state("priv_pt_std", clamp(tr_priv.get("p_trust_std", 0.69), 0.0, 2.0))
-
-    # Traits - Business
+        _stage_fields(batch, (tr_priv,), _PARAMS_TRAITS_PRIV_FIELD_MAP)
     tr_biz = params.get("traits_business", {})
     if tr_biz:
-        set_state("biz_audit_mean", clamp(tr_biz.get("subjective_audit_prob_mean", 22.0), 0.0, 100.0))
-        set_state("biz_audit_std", clamp(tr_biz.get("subjective_audit_prob_std", 5.0), 0.0, 50.0))
-        set_state("biz_pn_mean", clamp(tr_biz.get("personal_norms_mean", 3.82), 1.0, 5.0))
-        set_state("biz_pn_std", clamp(tr_biz.get("personal_norms_std", 1.04), 0.0, 2.0))
-        set_state("biz_sn_mean", clamp(tr_biz.get("social_norms_mean", 3.82), 1.0, 5.0))
-        set_state("biz_sn_std", clamp(tr_biz.get("social_norms_std", 1.02), 0.0, 2.0))
-        set_state("biz_stn_mean", clamp(tr_biz.get("societal_norms_mean", 4.12), 1.0, 5.0))
-        set_state("biz_stn_std", clamp(tr_biz.get("societal_norms_std", 0.98), 0.0, 2.0))
-        set_state("biz_pso_mean", clamp(tr_biz.get("pso_mean", 3.18), 1.0, 5.0))
-        set_state("biz_pso_std", clamp(tr_biz.get("pso_std", 0.67), 0.0, 2.0))
-        set_state("biz_pt_mean", clamp(tr_biz.get("p_trust_mean", 3.37), 1.0, 5.0))
-        set_state("biz_pt_std", clamp(tr_biz.get("p_trust_std", 0.69), 0.0, 2.0))
\ No newline at end of file
+        _stage_fields(batch, (tr_biz,), _PARAMS_TRAITS_BIZ_FIELD_MAP)
+
+    st.session_state.update(batch)
@@ -0,0 +1,41 @@
+"""Restoring a history entry maps its strategy names onto the selectbox options."""
+
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+APP_SCRIPT = f"""
+import sys
+sys.path.insert(0, {str(ROOT / "dashboard")!r})
+sys.path.insert(0, {str(ROOT)!r})
+
+import streamlit as st
+from pages import simulate
+from utils.history import load_history
+
+if "restored" not in st.session_state:
+    st.session_state.restored = True
+    entry = next(e for e in load_history()
+                 if e.get("params", {{}}).get("letter_strategy") == "risk_based")
+    simulate.load_params_into_state(entry["params"])
+    st.session_state.show_expert_settings = True
+    st.session_state.letter_enabled = True
+    st.session_state.phone_enabled = True
+st.session_state.current_page = "simulate"
+simulate.render()
+"""
+
+
+def test_risk_based_history_entry_restores_risk():
+    at = AppTest.from_string(APP_SCRIPT, default_timeout=60).run()
+    assert not at.exception
+    for key in ("sel_letter_strategy", "sel_phone_strategy"):
+        assert at.session_state[key] == "risk"
+        assert at.selectbox(key=key).value == "risk"
+
+
+if __name__ == "__main__":
+    test_risk_based_history_entry_restores_risk()
+    print("ok")